@@ -242,7 +242,8 @@ def etape_3_base_de_donnees():
         
         # Charger les données
         print("📥 Chargement des données...")
-        db.load_csv_data(data_file)
+        with db.bulk_load():
+            db.load_csv_data(data_file)
         
         # Afficher les statistiques
         print("\n📊 Statistiques de la base de données:")
@@ -0,0 +1,73 @@
+"""
+Noyaux de scoring compilés (Numba) - SmartMarketWatch
+Responsable: Équipe IA (Membre 2)
+Description: Versions JIT des calculs de score ligne à ligne, utilisées par
+            FeatureExtractor sur les gros catalogues lorsque Numba est installé
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # Pas de fastmath : il supposerait l'absence de NaN, or les specs manquantes sont des NaN
+    @njit(cache=True, parallel=True)
+    def perf_score(cpu_code, ram, stockage, is_ssd, gen, lut):
+        """
+        Calcule Performance_Index (0-100) en un seul passage sur les tableaux bruts
+
+        Args:
+            cpu_code (np.ndarray): Codes catégoriels du CPU (-1 = manquant)
+            ram (np.ndarray): RAM en GB (NaN si inconnue)
+            stockage (np.ndarray): Stockage en GB (NaN si inconnu)
+            is_ssd (np.ndarray): True si le stockage est un SSD
+            gen (np.ndarray): Génération du CPU (NaN si inconnue)
+            lut (np.ndarray): Score CPU par code, dernier élément = score du code -1
+        """
+        n = cpu_code.shape[0]
+        out = np.empty(n, np.float64)
+        for i in prange(n):
+            # Score CPU (40 points max)
+            s = lut[cpu_code[i]] * 0.4
+
+            # Score RAM (30 points max)
+            r = ram[i]
+            if r >= 32:
+                s += 30
+            elif r >= 16:
+                s += 25
+            elif r >= 8:
+                s += 18
+            elif r >= 4:
+                s += 10
+
+            # Score Stockage (20 points max)
+            st = stockage[i]
+            if st >= 512:
+                s += 15
+            elif st >= 256:
+                s += 10
+            elif st >= 128:
+                s += 5
+            if is_ssd[i] and not np.isnan(st):
+                s += 5
+
+            # Score Génération (10 points max)
+            g = gen[i]
+            if g >= 11:
+                s += 10
+            elif g >= 8:
+                s += 7
+            elif g >= 6:
+                s += 4
+            elif g >= 4:
+                s += 2
+
+            out[i] = min(round(s, 1), 100.0)  # Plafonner à 100
+        return out
@@ -46,7 +46,14 @@ class AdvancedAIPipeline:
         """Charge les données nettoyées"""
         logger.info(f"Chargement des données depuis {self.input_file}")
         try:
-            self.df = pd.read_csv(self.input_file, encoding='utf-8-sig')
+            # Copie Parquet typée (FeatureExtractor) si elle est au moins aussi récente que le CSV
+            parquet = Path(self.input_file).with_suffix('.parquet')
+            csv = Path(self.input_file)
+            if parquet.exists() and (not csv.exists() or parquet.stat().st_mtime >= csv.stat().st_mtime):
+                logger.info(f"Lecture de la copie Parquet {parquet}")
+                self.df = pd.read_parquet(parquet)
+            else:
+                self.df = pd.read_csv(self.input_file, encoding='utf-8-sig')
             self.stats['initial_columns'] = len(self.df.columns)
             logger.info(f"✓ {len(self.df)} produits chargés avec {self.stats['initial_columns']} colonnes")
             return True
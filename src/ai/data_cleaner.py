@@ -2,14 +2,43 @@
 Module de Nettoyage des Données - SmartMarketWatch
 Responsable: Équipe IA (Membre 2)
 Description: Nettoyage et standardisation des données brutes collectées par le module RPA
+
+Variable d'environnement:
+    SMW_USE_MODIN=1  Utilise modin.pandas (si installé) pour paralléliser les opérations DataFrame
 """
 
-import pandas as pd
+import os
+import numpy as np
 import re
 import logging
 from datetime import datetime
 from pathlib import Path
 
+# modin (optionnel, sur demande explicite) : remplaçant de pandas distribué sur Ray/Dask
+MODIN_ACTIVE = False
+if os.environ.get('SMW_USE_MODIN') == '1':
+    try:
+        import modin.pandas as pd
+        MODIN_ACTIVE = True
+    except ImportError:
+        import pandas as pd
+else:
+    import pandas as pd
+
+# pyarrow (optionnel) : lecteur CSV multi-thread et chaînes stockées en buffers Arrow contigus
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# numexpr (optionnel) : évaluation multi-thread des expressions sur les gros catalogues
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
 # Configuration du logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +50,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+if os.environ.get('SMW_USE_MODIN') == '1' and not MODIN_ACTIVE:
+    logger.warning("SMW_USE_MODIN=1 mais modin n'est pas installé - utilisation de pandas")
+
+# Mots-clés identifiant un accessoire (compilés une seule fois)
+MOTS_CLES_ACCESSOIRES = [
+    'souris', 'clavier', 'sac', 'sacoche', 'cartable', 'support', 
+    'tapis', 'chargeur', 'câble', 'adaptateur', 'écran', 'moniteur',
+    'enceinte', 'haut-parleur', 'casque', 'webcam', 'hub', 'station',
+    'refroidisseur', 'ventilateur', 'lampe', 'stickers', 'autocollant'
+]
+ACCESS_RE = re.compile('|'.join(re.escape(mot) for mot in MOTS_CLES_ACCESSOIRES), re.IGNORECASE)
+
+# Taille de catalogue à partir de laquelle numexpr devient rentable
+SEUIL_NUMEXPR = 10_000
+
+
+def _entier_compact(serie):
+    """Convertit une série numérique en entier non signé nullable le plus petit possible (UInt8/UInt16...)"""
+    return pd.to_numeric(pd.to_numeric(serie, errors='coerce').astype('UInt32'), downcast='unsigned')
+
 
 class DataCleaner:
     """Classe principale pour le nettoyage des données"""
@@ -41,12 +90,38 @@ class DataCleaner:
             'valeurs_manquantes_traitees': 0,
             'produits_finaux': 0
         }
+        # Cache des value_counts par colonne (invalidé dès que les lignes changent)
+        self._repartitions = {}
+        
+    def _repartition(self, colonne):
+        """
+        Retourne self.df[colonne].value_counts() en le calculant une seule fois
+        
+        Args:
+            colonne (str): Nom de la colonne catégorielle
+        """
+        if colonne not in self._repartitions:
+            self._repartitions[colonne] = self.df[colonne].value_counts()
+        return self._repartitions[colonne]
         
     def charger_donnees(self):
         """Charge les données brutes depuis le CSV"""
         try:
             logger.info(f"Chargement des données depuis {self.input_file}")
-            self.df = pd.read_csv(self.input_file, encoding='utf-8-sig')
+            # Copie Parquet typée (scraper) si elle est au moins aussi récente que le CSV
+            parquet = Path(self.input_file).with_suffix('.parquet')
+            csv = Path(self.input_file)
+            if PYARROW_AVAILABLE and parquet.exists() and (not csv.exists() or parquet.stat().st_mtime >= csv.stat().st_mtime):
+                logger.info(f"Lecture de la copie Parquet {parquet}")
+                self.df = pd.read_parquet(parquet, dtype_backend='pyarrow')
+                # Colonne propre à la copie Parquet : même schéma en sortie que depuis le CSV
+                self.df = self.df.drop(columns=['Discount_Pct'], errors='ignore')
+            elif PYARROW_AVAILABLE:
+                # Colonnes texte en string[pyarrow] : les .str.* passent par les noyaux Arrow
+                self.df = pd.read_csv(self.input_file, encoding='utf-8-sig',
+                                      engine='pyarrow', dtype_backend='pyarrow')
+            else:
+                self.df = pd.read_csv(self.input_file, encoding='utf-8-sig')
             self.stats['produits_initiaux'] = len(self.df)
             logger.info(f"✓ {self.stats['produits_initiaux']} produits chargés")
             return True
@@ -74,11 +149,16 @@ class DataCleaner:
             except:
                 return None
         
-        # Nettoyage du prix actuel
-        self.df['Prix_Actuel_Clean'] = self.df['Prix_Actuel'].apply(extraire_prix)
-        
-        # Nettoyage de l'ancien prix
-        self.df['Ancien_Prix_Clean'] = self.df['Ancien_Prix'].apply(extraire_prix)
+        if {'Prix_Num', 'Ancien_Prix_Num'} <= set(self.df.columns):
+            # Copie Parquet du scraper : prix déjà convertis, selon la même règle
+            self.df['Prix_Actuel_Clean'] = self.df.pop('Prix_Num').astype('float64')
+            self.df['Ancien_Prix_Clean'] = self.df.pop('Ancien_Prix_Num').astype('float64')
+        else:
+            # Nettoyage du prix actuel
+            self.df['Prix_Actuel_Clean'] = self.df['Prix_Actuel'].apply(extraire_prix)
+            
+            # Nettoyage de l'ancien prix
+            self.df['Ancien_Prix_Clean'] = self.df['Ancien_Prix'].apply(extraire_prix)
         
         # Calcul de la réduction réelle - CORRECTION
         def calculer_reduction(row):
@@ -92,7 +172,7 @@ class DataCleaner:
             reduction = ((ancien - actuel) / ancien) * 100
             return round(reduction, 2)
         
-        self.df['Reduction_Reelle'] = self.df.apply(calculer_reduction, axis=1)
+        self.df['Reduction_Reelle'] = self.df.apply(calculer_reduction, axis=1).astype('float32')
         
         logger.info(f"✓ Prix nettoyés - Moyenne: {self.df['Prix_Actuel_Clean'].mean():.2f} Dhs")
         
@@ -145,7 +225,7 @@ class DataCleaner:
         self.df['Marque'] = self.df['Titre'].apply(detecter_marque)
         
         # Statistiques par marque
-        repartition = self.df['Marque'].value_counts()
+        repartition = self._repartition('Marque')
         logger.info(f"✓ Marques extraites - Top 3: {repartition.head(3).to_dict()}")
         
     def extraire_specs_techniques(self):
@@ -197,37 +277,30 @@ class DataCleaner:
                 return int(match.group(1))
             return None
         
-        # Extraction du stockage
-        def extraire_stockage(titre):
-            """Détecte la capacité et le type de stockage"""
-            # Cherche SSD
-            ssd_match = re.search(r'(\d+)\s*[Gg][Bb]?\s*SSD', str(titre), re.IGNORECASE)
-            if ssd_match:
-                return int(ssd_match.group(1)), 'SSD'
-            
-            # Cherche HDD
-            hdd_match = re.search(r'(\d+)\s*[Gg][Bb]?\s*(?:HDD|GO)', str(titre), re.IGNORECASE)
-            if hdd_match:
-                return int(hdd_match.group(1)), 'HDD'
-            
-            # Cherche format "500Go" ou "1TB"
-            storage_match = re.search(r'(\d+)\s*(?:GB|Go|TB|To)', str(titre), re.IGNORECASE)
-            if storage_match:
-                capacite = int(storage_match.group(1))
-                if 'TB' in str(titre).upper() or 'TO' in str(titre).upper():
-                    capacite *= 1024  # Convertir TB en GB
-                return capacite, 'Inconnu'
-            
-            return None, None
-        
         # Application des fonctions
         self.df['CPU'] = self.df['Titre'].apply(extraire_cpu)
-        self.df['Generation_CPU'] = self.df['Titre'].apply(extraire_generation)
-        self.df['RAM_GB'] = self.df['Titre'].apply(extraire_ram)
+        self.df['Generation_CPU'] = _entier_compact(self.df['Titre'].apply(extraire_generation))
+        self.df['RAM_GB'] = _entier_compact(self.df['Titre'].apply(extraire_ram))
+        
+        # Extraction du stockage (vectorisée) - priorité : SSD, puis HDD, puis format "500Go" ou "1TB"
+        def capacite(motif):
+            """Première capacité capturée par le motif, NaN si absente"""
+            # Groupe nommé et (?i) en ligne : requis par le moteur regex d'Arrow
+            extrait = self.df['Titre'].str.extract(motif, expand=False)
+            return pd.to_numeric(extrait).to_numpy(dtype='float64', na_value=np.nan)
+        
+        ssd = capacite(r'(?i)(?P<capacite>\d+)\s*[Gg][Bb]?\s*SSD')
+        hdd = capacite(r'(?i)(?P<capacite>\d+)\s*[Gg][Bb]?\s*(?:HDD|GO)')
+        autre = capacite(r'(?i)(?P<capacite>\d+)\s*(?:GB|Go|TB|To)')
+        
+        # Convertir TB en GB dès que le titre mentionne TB/To
+        en_to = self.df['Titre'].str.contains('TB|TO', case=False, na=False).to_numpy()
+        autre = np.where(en_to, autre * 1024, autre)
         
-        stockage_data = self.df['Titre'].apply(extraire_stockage)
-        self.df['Stockage_GB'] = stockage_data.apply(lambda x: x[0] if x[0] is not None else None)
-        self.df['Type_Stockage'] = stockage_data.apply(lambda x: x[1] if x[1] is not None else None)
+        conditions = [~np.isnan(ssd), ~np.isnan(hdd), ~np.isnan(autre)]
+        stockage = pd.Series(np.select(conditions, [ssd, hdd, autre], default=np.nan), index=self.df.index)
+        self.df['Stockage_GB'] = _entier_compact(stockage)
+        self.df['Type_Stockage'] = np.select(conditions, ['SSD', 'HDD', 'Inconnu'], default=None)
         
         logger.info(f"✓ Spécifications extraites")
         
@@ -251,7 +324,7 @@ class DataCleaner:
         
         self.df['Etat_Produit'] = self.df['Titre'].apply(classifier_etat)
         
-        repartition = self.df['Etat_Produit'].value_counts()
+        repartition = self._repartition('Etat_Produit')
         logger.info(f"✓ États détectés: {repartition.to_dict()}")
         
     def filtrer_accessoires(self):
@@ -260,22 +333,13 @@ class DataCleaner:
         """
         logger.info("Filtrage des accessoires...")
         
-        mots_cles_accessoires = [
-            'souris', 'clavier', 'sac', 'sacoche', 'cartable', 'support', 
-            'tapis', 'chargeur', 'câble', 'adaptateur', 'écran', 'moniteur',
-            'enceinte', 'haut-parleur', 'casque', 'webcam', 'hub', 'station',
-            'refroidisseur', 'ventilateur', 'lampe', 'stickers', 'autocollant'
-        ]
-        
-        def est_accessoire(titre):
-            """Vérifie si le produit est un accessoire"""
-            titre_lower = str(titre).lower()
-            return any(mot in titre_lower for mot in mots_cles_accessoires)
-        
-        accessoires = self.df[self.df['Titre'].apply(est_accessoire)]
-        self.stats['accessoires_filtres'] = len(accessoires)
+        # Masque calculé une seule fois : sert au comptage et au filtrage
+        # Motif passé en texte : compatible avec le moteur regex d'Arrow (RE2)
+        mask = self.df['Titre'].str.contains(ACCESS_RE.pattern, case=False, na=False, regex=True)
+        self.stats['accessoires_filtres'] = int(mask.sum())
         
-        self.df = self.df[~self.df['Titre'].apply(est_accessoire)]
+        self.df = self.df.loc[~mask].reset_index(drop=True)
+        self._repartitions.clear()
         
         logger.info(f"✓ {self.stats['accessoires_filtres']} accessoires filtrés")
         
@@ -287,6 +351,7 @@ class DataCleaner:
         
         nb_avant = len(self.df)
         self.df = self.df.drop_duplicates(subset=['Image_URL'], keep='first')
+        self._repartitions.clear()
         nb_apres = len(self.df)
         
         self.stats['doublons_supprimes'] = nb_avant - nb_apres
@@ -303,13 +368,17 @@ class DataCleaner:
             'Prix_Actuel_Clean', 'Marque', 'CPU', 'RAM_GB', 
             'Stockage_GB', 'Rating_Clean'
         ]
+        nb_colonnes = len(colonnes_importantes)
         
-        def calculer_score(row):
-            """Calcule le % de champs remplis"""
-            remplis = sum(1 for col in colonnes_importantes if pd.notna(row[col]))
-            return round((remplis / len(colonnes_importantes)) * 100, 1)
+        # Nombre de champs remplis par produit (une seule réduction C)
+        remplis = self.df[colonnes_importantes].notna().sum(axis=1).to_numpy()
         
-        self.df['Taux_Completude'] = self.df.apply(calculer_score, axis=1)
+        if NUMEXPR_AVAILABLE and len(self.df) >= SEUIL_NUMEXPR:
+            taux = ne.evaluate("(remplis / nb_colonnes) * 100")
+        else:
+            taux = (remplis / nb_colonnes) * 100
+        
+        self.df['Taux_Completude'] = np.round(taux, 1).astype('float32')
         
         moyenne_completude = self.df['Taux_Completude'].mean()
         logger.info(f"✓ Complétude moyenne: {moyenne_completude:.1f}%")
@@ -321,31 +390,27 @@ class DataCleaner:
         """
         logger.info("Classification par gamme...")
         
-        def determiner_gamme(row):
-            """Détermine la gamme du produit"""
-            prix = row['Prix_Actuel_Clean']
-            cpu = row['CPU']
-            ram = row['RAM_GB']
-            
-            # Si données manquantes, classification par prix uniquement
-            if pd.isna(prix):
-                return 'Non classé'
-            
-            # Haut de gamme
-            if prix > 5000 or cpu in ['i7', 'i9', 'Ryzen 7', 'Ryzen 9'] or (pd.notna(ram) and ram >= 16):
-                return 'Haut de gamme'
-            
-            # Entrée de gamme
-            elif prix < 2500 or cpu in ['Celeron', 'Pentium', 'i3'] or (pd.notna(ram) and ram <= 4):
-                return 'Entrée de gamme'
-            
-            # Milieu de gamme
-            else:
-                return 'Milieu de gamme'
-        
-        self.df['Gamme'] = self.df.apply(determiner_gamme, axis=1)
-        
-        repartition = self.df['Gamme'].value_counts()
+        prix = self.df['Prix_Actuel_Clean'].to_numpy(dtype='float64', na_value=np.nan)
+        ram = self.df['RAM_GB'].to_numpy(dtype='float64', na_value=np.nan)
+        cpu_haut = self.df['CPU'].isin(['i7', 'i9', 'Ryzen 7', 'Ryzen 9']).to_numpy()
+        cpu_bas = self.df['CPU'].isin(['Celeron', 'Pentium', 'i3']).to_numpy()
+        
+        # Les comparaisons avec NaN valent False : une RAM manquante ne compte pas
+        if NUMEXPR_AVAILABLE and len(self.df) >= SEUIL_NUMEXPR:
+            est_haut = ne.evaluate("(prix > 5000) | cpu_haut | (ram >= 16)")
+            est_bas = ne.evaluate("(prix < 2500) | cpu_bas | (ram <= 4)")
+        else:
+            est_haut = (prix > 5000) | cpu_haut | (ram >= 16)
+            est_bas = (prix < 2500) | cpu_bas | (ram <= 4)
+        
+        # Si prix manquant : non classé ; sinon Haut > Entrée > Milieu de gamme
+        self.df['Gamme'] = np.select(
+            [np.isnan(prix), est_haut, est_bas],
+            ['Non classé', 'Haut de gamme', 'Entrée de gamme'],
+            default='Milieu de gamme'
+        )
+        
+        repartition = self._repartition('Gamme')
         logger.info(f"✓ Gammes: {repartition.to_dict()}")
         
     def generer_rapport_qualite(self):
@@ -354,6 +419,13 @@ class DataCleaner:
         """
         logger.info("Génération du rapport de qualité...")
         
+        # Agrégats pré-calculés : une seule réduction notna() pour toutes les colonnes
+        n = len(self.df)
+        remplis = self.df[['Prix_Actuel_Clean', 'RAM_GB', 'Stockage_GB', 'Rating_Clean']].notna().sum()
+        remplis['Marque'] = n - self._repartition('Marque').get('Autre', 0)
+        remplis['CPU'] = (self.df['CPU'] != 'Autre').sum()
+        taux = (remplis / n * 100) if n else remplis * 0.0
+        
         rapport = f"""
 ========================================
 RAPPORT DE QUALITÉ DES DONNÉES
@@ -364,15 +436,15 @@ STATISTIQUES GÉNÉRALES:
 - Produits initiaux:        {self.stats['produits_initiaux']}
 - Doublons supprimés:        {self.stats['doublons_supprimes']}
 - Accessoires filtrés:       {self.stats['accessoires_filtres']}
-- Produits finaux:           {len(self.df)}
+- Produits finaux:           {n}
 
 COMPLÉTUDE DES DONNÉES:
-- Prix:                      {self.df['Prix_Actuel_Clean'].notna().sum()} / {len(self.df)} ({self.df['Prix_Actuel_Clean'].notna().sum()/len(self.df)*100:.1f}%)
-- Marque:                    {(self.df['Marque'] != 'Autre').sum()} / {len(self.df)} ({(self.df['Marque'] != 'Autre').sum()/len(self.df)*100:.1f}%)
-- CPU:                       {(self.df['CPU'] != 'Autre').sum()} / {len(self.df)} ({(self.df['CPU'] != 'Autre').sum()/len(self.df)*100:.1f}%)
-- RAM:                       {self.df['RAM_GB'].notna().sum()} / {len(self.df)} ({self.df['RAM_GB'].notna().sum()/len(self.df)*100:.1f}%)
-- Stockage:                  {self.df['Stockage_GB'].notna().sum()} / {len(self.df)} ({self.df['Stockage_GB'].notna().sum()/len(self.df)*100:.1f}%)
-- Rating:                    {self.df['Rating_Clean'].notna().sum()} / {len(self.df)} ({self.df['Rating_Clean'].notna().sum()/len(self.df)*100:.1f}%)
+- Prix:                      {remplis['Prix_Actuel_Clean']} / {n} ({taux['Prix_Actuel_Clean']:.1f}%)
+- Marque:                    {remplis['Marque']} / {n} ({taux['Marque']:.1f}%)
+- CPU:                       {remplis['CPU']} / {n} ({taux['CPU']:.1f}%)
+- RAM:                       {remplis['RAM_GB']} / {n} ({taux['RAM_GB']:.1f}%)
+- Stockage:                  {remplis['Stockage_GB']} / {n} ({taux['Stockage_GB']:.1f}%)
+- Rating:                    {remplis['Rating_Clean']} / {n} ({taux['Rating_Clean']:.1f}%)
 
 STATISTIQUES PRIX:
 - Prix moyen:                {self.df['Prix_Actuel_Clean'].mean():.2f} Dhs
@@ -381,13 +453,13 @@ STATISTIQUES PRIX:
 - Réduction moyenne:         {self.df['Reduction_Reelle'].mean():.1f}%
 
 RÉPARTITION PAR MARQUE:
-{self.df['Marque'].value_counts().to_string()}
+{self._repartition('Marque').to_string()}
 
 RÉPARTITION PAR GAMME:
-{self.df['Gamme'].value_counts().to_string()}
+{self._repartition('Gamme').to_string()}
 
 RÉPARTITION PAR ÉTAT:
-{self.df['Etat_Produit'].value_counts().to_string()}
+{self._repartition('Etat_Produit').to_string()}
 
 ========================================
 """
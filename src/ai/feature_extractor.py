@@ -7,6 +7,8 @@ Description: Analyse de sentiment et création d'indicateurs avancés
 import pandas as pd
 import numpy as np
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Pour l'analyse de sentiment (optionnel si vous avez des commentaires)
@@ -17,6 +19,19 @@ except ImportError:
     TEXTBLOB_AVAILABLE = False
     logging.warning("TextBlob non installé - Analyse de sentiment désactivée")
 
+# Noyaux Numba (optionnels) pour les gros catalogues
+try:
+    from . import _scoring_kernels as kernels
+except ImportError:  # Exécution directe : python src/ai/feature_extractor.py
+    import _scoring_kernels as kernels
+
+# pyarrow (optionnel) : lecteur CSV multi-thread
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Configuration du logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +39,101 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Dictionnaires de scores
+CPU_SCORES = {
+    'i9': 100, 'Ryzen 9': 100,
+    'i7': 85, 'Ryzen 7': 85,
+    'i5': 60, 'Ryzen 5': 60,
+    'i3': 35, 'Ryzen 3': 35,
+    'Pentium': 20,
+    'Celeron': 10,
+    'Autre': 0
+}
+
+ETAT_SCORES = {
+    'Neuf': 10,
+    'Remis à neuf': 7,
+    'Occasion': 4,
+    'Non spécifié': 2
+}
+
+# Taille de catalogue à partir de laquelle la compilation Numba est rentable
+SEUIL_NUMBA = 10_000
+
+# Nombre de titres distincts à partir duquel TextBlob est réparti sur plusieurs processus
+SEUIL_SENTIMENT_PARALLELE = 5_000
+NB_WORKERS = os.cpu_count() or 1
+
+# Colonnes texte à faible cardinalité, stockées en category (codes entiers)
+COLONNES_CATEGORIELLES = ['Marque', 'CPU', 'Type_Stockage', 'Etat_Produit', 'Gamme']
+
+# Schéma de lecture : specs entières en float32 (exactes jusqu'à 2**24, NaN conservés).
+# Prix, rating et complétude restent en float64 pour ne pas décaler les arrondis des scores.
+SCHEMA_DONNEES = {
+    **{col: 'category' for col in COLONNES_CATEGORIELLES},
+    'Generation_CPU': 'float32',
+    'RAM_GB': 'float32',
+    'Stockage_GB': 'float32',
+}
+
+# Ratios stockés en float32 par _downcast() : au plus 2 décimales et < 100,
+# donc np.round(x, 2) retrouve exactement la valeur float64 d'origine
+COLONNES_RATIOS = ['Rating_Clean', 'Taux_Completude', 'Reduction_Reelle']
+
+
+def _scores_par_code(serie, scores):
+    """
+    Score de chaque ligne d'une colonne catégorielle via une table indexée par code
+    
+    Args:
+        serie (pd.Series): Colonne de dtype category
+        scores (dict): Score par catégorie (0 si absente)
+    """
+    return _table_scores(serie, scores)[serie.cat.codes.to_numpy()]
+
+
+def _table_scores(serie, scores):
+    """Table des scores indexée par code catégoriel ; le 0 final est lu par le code -1 (valeur manquante)"""
+    return np.array([scores.get(c, 0) for c in serie.cat.categories] + [0], dtype='float64')
+
+
+def _polarite(texte):
+    """Polarité TextBlob d'un texte (-1 à +1), 0.0 en cas d'erreur"""
+    try:
+        return TextBlob(str(texte)).sentiment.polarity
+    except Exception:
+        return 0.0
+
+
+def _titres_a_analyser(titres):
+    """
+    Codes des titres et liste des titres distincts à analyser
+    
+    Chaque titre distinct n'est analysé qu'une seule fois (les titres se répètent beaucoup).
+    Le dernier élément est lu par le code -1 (titre manquant, analysé comme 'nan')
+    """
+    codes, titres_uniques = pd.factorize(titres)
+    return codes, list(titres_uniques) + [np.nan]
+
+
+def _taille_lot(nb_textes):
+    """Taille des lots envoyés aux workers : ~4 lots par worker pour équilibrer la charge"""
+    return max(1, nb_textes // (4 * NB_WORKERS))
+
+
+def _sentiments(codes, polarites):
+    """
+    Score (arrondi à 3 décimales) et label de sentiment de chaque produit
+    
+    Args:
+        codes (np.ndarray): Code du titre de chaque produit (_titres_a_analyser)
+        polarites (iterable): Polarité de chaque titre distinct, dans l'ordre des codes
+    """
+    polarites = np.fromiter(polarites, dtype='float64')
+    scores = np.array([round(p, 3) for p in polarites.tolist()], dtype='float64')
+    labels = np.where(polarites > 0.2, "Positif", np.where(polarites < -0.2, "Négatif", "Neutre"))
+    return scores[codes], labels[codes]
+
 
 class FeatureExtractor:
     """Classe pour l'extraction de features avancées"""
@@ -37,87 +147,151 @@ class FeatureExtractor:
         """
         self.input_file = input_file
         self.df = None
+        self._scores_computed = False
+        self._colonnes_preparees = False
+        self._nouvelles_colonnes = {}
+        self._sentiment_en_cours = None
         
     def charger_donnees(self):
         """Charge les données nettoyées"""
         try:
             logger.info(f"Chargement des données depuis {self.input_file}")
-            self.df = pd.read_csv(self.input_file, encoding='utf-8-sig')
+            # Types fixés dès la lecture : pas de colonnes object converties après coup
+            moteur = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+            self.df = pd.read_csv(self.input_file, encoding='utf-8-sig',
+                                  engine=moteur, dtype=SCHEMA_DONNEES)
+            self._scores_computed = False
+            self._colonnes_preparees = False
+            self._nouvelles_colonnes = {}
+            self._sentiment_en_cours = None
             logger.info(f"✓ {len(self.df)} produits chargés")
             return True
         except Exception as e:
             logger.error(f"✗ Erreur lors du chargement: {e}")
             return False
     
-    def calculer_score_performance(self):
+    def _prepare_columns(self):
         """
-        Calcule un indice de performance basé sur les specs
-        Crée la colonne: Performance_Index (0-100)
+        Prépare une fois les colonnes partagées par les étapes suivantes :
+        dtypes compacts et tables de scores CPU / état indexées par code
         """
-        logger.info("Calcul de l'indice de performance...")
-        
-        # Dictionnaires de scores
-        cpu_scores = {
-            'i9': 100, 'Ryzen 9': 100,
-            'i7': 85, 'Ryzen 7': 85,
-            'i5': 60, 'Ryzen 5': 60,
-            'i3': 35, 'Ryzen 3': 35,
-            'Pentium': 20,
-            'Celeron': 10,
-            'Autre': 0
-        }
-        
-        def calculer_score(row):
-            """Calcule le score de performance"""
-            score = 0
-            
+        # Filet de sécurité si self.df n'a pas été lu avec SCHEMA_DONNEES
+        for col in COLONNES_CATEGORIELLES:
+            if col in self.df.columns and self.df[col].dtype != 'category':
+                self.df[col] = self.df[col].astype('category')
+        self._downcast()
+        
+        self._cpu_codes = self.df['CPU'].cat.codes.to_numpy()
+        self._cpu_lut = _table_scores(self.df['CPU'], CPU_SCORES)
+        self._etat_scores = _scores_par_code(self.df['Etat_Produit'], ETAT_SCORES)
+        self._colonnes_preparees = True
+    
+    def _downcast(self):
+        """Réduit les ratios en float32 pour alléger les colonnes chaudes du scoring"""
+        for col in COLONNES_RATIOS:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('float32')
+    
+    def _ratio(self, col):
+        """Colonne ratio en float64, arrondie à 2 décimales pour effacer l'erreur du float32"""
+        return np.round(self.df[col].to_numpy(dtype='float64', na_value=np.nan), 2)
+    
+    def _ajouter_colonnes(self, **colonnes):
+        """Met de côté des colonnes calculées ; elles sont écrites ensemble par _appliquer_colonnes()"""
+        self._nouvelles_colonnes.update(colonnes)
+    
+    def _colonne(self, nom):
+        """Valeurs d'une colonne, qu'elle soit encore en attente ou déjà dans self.df"""
+        if nom in self._nouvelles_colonnes:
+            return np.asarray(self._nouvelles_colonnes[nom])
+        return self.df[nom].to_numpy()
+    
+    def _appliquer_colonnes(self):
+        """Ajoute toutes les colonnes en attente à self.df en un seul concat"""
+        if not self._nouvelles_colonnes:
+            return
+        nouvelles = pd.DataFrame(self._nouvelles_colonnes, index=self.df.index)
+        # Une colonne recalculée remplace l'ancienne au lieu d'être dupliquée
+        self.df = pd.concat([self.df.drop(columns=nouvelles.columns, errors='ignore'), nouvelles], axis=1)
+        self._nouvelles_colonnes = {}
+    
+    def _compute_scores(self):
+        """
+        Noyau fusionné : calcule Performance_Index, Score_Qualite et RQP_Score
+        en un seul passage NumPy, sans relire les colonnes intermédiaires dans self.df
+        """
+        if self._scores_computed:
+            return
+        if not self._colonnes_preparees:
+            self._prepare_columns()
+        
+        # Colonnes extraites une seule fois en tableaux NumPy (NaN -> comparaisons fausses)
+        ram = self.df['RAM_GB'].to_numpy(dtype='float64', na_value=np.nan)
+        stockage = self.df['Stockage_GB'].to_numpy(dtype='float64', na_value=np.nan)
+        gen = self.df['Generation_CPU'].to_numpy(dtype='float64', na_value=np.nan)
+        est_ssd = (self.df['Type_Stockage'] == 'SSD').to_numpy(dtype=bool, na_value=False)
+        rating = self._ratio('Rating_Clean')
+        completude = self._ratio('Taux_Completude')
+        reduction = self._ratio('Reduction_Reelle')
+        prix = self.df['Prix_Actuel_Clean'].to_numpy(dtype='float64', na_value=np.nan)
+        
+        # Masques de présence calculés une fois, réutilisés par les trois scores
+        stockage_ok = ~np.isnan(stockage)
+        rating_ok = ~np.isnan(rating)
+        prix_ok = ~np.isnan(prix)
+        
+        # --- Performance ---
+        if kernels.NUMBA_AVAILABLE and len(self.df) >= SEUIL_NUMBA:
+            perf = kernels.perf_score(self._cpu_codes, ram, stockage, est_ssd, gen, self._cpu_lut)
+        else:
             # Score CPU (40 points max)
-            cpu_score = cpu_scores.get(row['CPU'], 0)
-            score += cpu_score * 0.4
+            perf = self._cpu_lut[self._cpu_codes] * 0.4
             
             # Score RAM (30 points max)
-            ram = row['RAM_GB']
-            if pd.notna(ram):
-                if ram >= 32:
-                    score += 30
-                elif ram >= 16:
-                    score += 25
-                elif ram >= 8:
-                    score += 18
-                elif ram >= 4:
-                    score += 10
+            perf += np.select([ram >= 32, ram >= 16, ram >= 8, ram >= 4], [30, 25, 18, 10], default=0)
             
             # Score Stockage (20 points max)
-            stockage = row['Stockage_GB']
-            type_stockage = row['Type_Stockage']
-            if pd.notna(stockage):
-                if stockage >= 512:
-                    score += 15
-                elif stockage >= 256:
-                    score += 10
-                elif stockage >= 128:
-                    score += 5
-                
-                if type_stockage == 'SSD':
-                    score += 5
+            perf += np.select([stockage >= 512, stockage >= 256, stockage >= 128], [15, 10, 5], default=0)
+            perf += (est_ssd & stockage_ok) * 5
             
             # Score Génération (10 points max)
-            gen = row['Generation_CPU']
-            if pd.notna(gen):
-                if gen >= 11:
-                    score += 10
-                elif gen >= 8:
-                    score += 7
-                elif gen >= 6:
-                    score += 4
-                elif gen >= 4:
-                    score += 2
+            perf += np.select([gen >= 11, gen >= 8, gen >= 6, gen >= 4], [10, 7, 4, 2], default=0)
             
-            return min(round(score, 1), 100)  # Plafonner à 100
+            perf = np.minimum(np.round(perf, 1), 100)  # Plafonner à 100
+        
+        # --- Qualité ---
+        # 1. Performance (40%)
+        qual = perf * 0.40
+        
+        # 2. Rating (30%) - ignoré si absent
+        qual += np.where(rating_ok, (rating / 5) * 30, 0)
+        
+        # 3. Complétude (15%)
+        qual += (completude / 100) * 15
         
-        self.df['Performance_Index'] = self.df.apply(calculer_score, axis=1)
+        # 4. État du produit (10%)
+        qual += self._etat_scores
         
-        logger.info(f"✓ Performance moyenne: {self.df['Performance_Index'].mean():.1f}/100")
+        # 5. Bonus réduction (5%) - max 5 points, uniquement si réduction > 0
+        qual += np.where(reduction > 0, np.minimum(reduction / 20, 5), 0)
+        
+        qual = np.minimum(np.round(qual, 1), 100)
+        
+        # --- Rapport qualité/prix --- (0 si prix absent ou nul)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rqp = np.round(np.where(prix_ok & (prix > 0), (qual / prix) * 1000.0, 0.0), 2)
+        
+        self._ajouter_colonnes(Performance_Index=perf, Score_Qualite=qual, RQP_Score=rqp)
+        self._scores_computed = True
+    
+    def calculer_score_performance(self):
+        """
+        Calcule un indice de performance basé sur les specs
+        Crée la colonne: Performance_Index (0-100)
+        """
+        logger.info("Calcul de l'indice de performance...")
+        self._compute_scores()
+        logger.info(f"✓ Performance moyenne: {self._colonne('Performance_Index').mean():.1f}/100")
     
     def calculer_score_qualite(self):
         """
@@ -125,40 +299,8 @@ class FeatureExtractor:
         Crée la colonne: Score_Qualite (0-100)
         """
         logger.info("Calcul du score de qualité...")
-        
-        def calculer_score(row):
-            """Calcule le score de qualité global"""
-            score = 0
-            
-            # 1. Performance (40%)
-            score += row['Performance_Index'] * 0.40
-            
-            # 2. Rating (30%)
-            if pd.notna(row['Rating_Clean']):
-                score += (row['Rating_Clean'] / 5) * 30
-            
-            # 3. Complétude (15%)
-            score += (row['Taux_Completude'] / 100) * 15
-            
-            # 4. État du produit (10%)
-            etat_scores = {
-                'Neuf': 10,
-                'Remis à neuf': 7,
-                'Occasion': 4,
-                'Non spécifié': 2
-            }
-            score += etat_scores.get(row['Etat_Produit'], 0)
-            
-            # 5. Bonus réduction (5%)
-            if pd.notna(row['Reduction_Reelle']) and row['Reduction_Reelle'] > 0:
-                bonus_reduction = min(row['Reduction_Reelle'] / 20, 5)  # Max 5 points
-                score += bonus_reduction
-            
-            return min(round(score, 1), 100)
-        
-        self.df['Score_Qualite'] = self.df.apply(calculer_score, axis=1)
-        
-        logger.info(f"✓ Score qualité moyen: {self.df['Score_Qualite'].mean():.1f}/100")
+        self._compute_scores()
+        logger.info(f"✓ Score qualité moyen: {self._colonne('Score_Qualite').mean():.1f}/100")
     
     def calculer_rapport_qualite_prix(self):
         """
@@ -166,17 +308,8 @@ class FeatureExtractor:
         Crée la colonne: RQP_Score (plus c'est élevé, meilleure est l'affaire)
         """
         logger.info("Calcul du rapport qualité/prix...")
-        
-        def calculer_rqp(row):
-            """Calcule le ratio qualité/prix"""
-            if pd.isna(row['Prix_Actuel_Clean']) or row['Prix_Actuel_Clean'] == 0:
-                return 0
-            
-            return round((row['Score_Qualite'] / row['Prix_Actuel_Clean']) * 1000, 2)
-        
-        self.df['RQP_Score'] = self.df.apply(calculer_rqp, axis=1)
-        
-        logger.info(f"✓ RQP moyen: {self.df['RQP_Score'].mean():.2f}")
+        self._compute_scores()
+        logger.info(f"✓ RQP moyen: {self._colonne('RQP_Score').mean():.2f}")
     
     def detecter_bonnes_affaires(self):
         """
@@ -185,37 +318,26 @@ class FeatureExtractor:
         """
         logger.info("Détection des bonnes affaires...")
         
-        # Calculer les quartiles du RQP
-        q75 = self.df['RQP_Score'].quantile(0.75)
-        q90 = self.df['RQP_Score'].quantile(0.90)
+        rqp = self._colonne('RQP_Score').astype('float64')
+        reduction = self._ratio('Reduction_Reelle')
+        score = self._colonne('Score_Qualite').astype('float64')
         
-        def classifier_affaire(row):
-            """Classifie le type d'affaire"""
-            rqp = row['RQP_Score']
-            reduction = row['Reduction_Reelle']
-            score = row['Score_Qualite']
-            
-            # Excellente affaire
-            if rqp >= q90 and score >= 70:
-                return True, "Excellente affaire"
-            
-            # Bonne affaire
-            elif rqp >= q75 and score >= 60:
-                return True, "Bonne affaire"
-            
-            # Promotion intéressante
-            elif pd.notna(reduction) and reduction >= 40 and score >= 50:
-                return True, "Promotion intéressante"
-            
-            # Affaire standard
-            else:
-                return False, "Standard"
+        # Calculer les quartiles du RQP en un seul appel (NaN ignorés comme Series.quantile)
+        q75, q90 = np.nanquantile(rqp, [0.75, 0.90])
+        
+        # Conditions par ordre de priorité (NaN -> comparaisons fausses)
+        conditions = [
+            (rqp >= q90) & (score >= 70),          # Excellente affaire
+            (rqp >= q75) & (score >= 60),          # Bonne affaire
+            (reduction >= 40) & (score >= 50),     # Promotion intéressante
+        ]
+        types = ["Excellente affaire", "Bonne affaire", "Promotion intéressante"]
         
-        affaires = self.df.apply(classifier_affaire, axis=1)
-        self.df['Est_Bonne_Affaire'] = affaires.apply(lambda x: x[0])
-        self.df['Type_Affaire'] = affaires.apply(lambda x: x[1])
+        type_affaire = np.select(conditions, types, default="Standard")
+        est_bonne_affaire = type_affaire != "Standard"
+        self._ajouter_colonnes(Est_Bonne_Affaire=est_bonne_affaire, Type_Affaire=type_affaire)
         
-        nb_bonnes_affaires = self.df['Est_Bonne_Affaire'].sum()
+        nb_bonnes_affaires = est_bonne_affaire.sum()
         logger.info(f"✓ {nb_bonnes_affaires} bonnes affaires détectées")
     
     def detecter_anomalies_prix(self):
@@ -225,39 +347,30 @@ class FeatureExtractor:
         """
         logger.info("Détection des anomalies de prix...")
         
-        anomalies = []
-        types_anomalies = []
+        prix = self.df['Prix_Actuel_Clean'].to_numpy(dtype='float64', na_value=np.nan)
+        performance = self._colonne('Performance_Index').astype('float64')
+        gamme = self.df['Gamme'].to_numpy()
         
-        for idx, row in self.df.iterrows():
-            prix = row['Prix_Actuel_Clean']
-            performance = row['Performance_Index']
-            gamme = row['Gamme']
-            
-            est_anomalie = False
-            type_anomalie = "Normal"
-            
-            # Anomalie 1: Prix trop bas pour les specs
-            if pd.notna(prix) and pd.notna(performance):
-                if performance >= 80 and prix < 3000:
-                    est_anomalie = True
-                    type_anomalie = "Prix suspect (trop bas)"
-                
-                elif performance <= 30 and prix > 4000:
-                    est_anomalie = True
-                    type_anomalie = "Prix suspect (trop élevé)"
-            
-            # Anomalie 2: Incohérence gamme/prix
-            if gamme == "Haut de gamme" and pd.notna(prix) and prix < 2500:
-                est_anomalie = True
-                type_anomalie = "Incohérence gamme/prix"
-            
-            anomalies.append(est_anomalie)
-            types_anomalies.append(type_anomalie)
+        # Masques de présence construits une fois et combinés à chaque règle
+        prix_ok = ~np.isnan(prix)
+        valide = prix_ok & ~np.isnan(performance)
         
-        self.df['Anomalie_Prix'] = anomalies
-        self.df['Type_Anomalie'] = types_anomalies
+        # Anomalie 1: Prix trop bas / trop élevé pour les specs
+        trop_bas = valide & (performance >= 80) & (prix < 3000)
+        trop_eleve = valide & (performance <= 30) & (prix > 4000)
         
-        nb_anomalies = sum(anomalies)
+        # Anomalie 2: Incohérence gamme/prix (prioritaire sur l'anomalie 1)
+        incoherence = prix_ok & (gamme == "Haut de gamme") & (prix < 2500)
+        
+        anomalies = trop_bas | trop_eleve | incoherence
+        type_anomalie = np.select(
+            [incoherence, trop_bas, trop_eleve],
+            ["Incohérence gamme/prix", "Prix suspect (trop bas)", "Prix suspect (trop élevé)"],
+            default="Normal"
+        )
+        self._ajouter_colonnes(Anomalie_Prix=anomalies, Type_Anomalie=type_anomalie)
+        
+        nb_anomalies = int(anomalies.sum())
         logger.info(f"✓ {nb_anomalies} anomalies de prix détectées")
     
     def analyser_sentiment_description(self):
@@ -269,40 +382,48 @@ class FeatureExtractor:
         """
         if not TEXTBLOB_AVAILABLE:
             logger.warning("⚠ TextBlob non disponible - Analyse de sentiment ignorée")
-            self.df['Sentiment_Score'] = 0.0
-            self.df['Sentiment_Label'] = 'Neutre'
+            self._ajouter_colonnes(Sentiment_Score=np.zeros(len(self.df)),
+                                   Sentiment_Label=np.full(len(self.df), 'Neutre', dtype=object))
             return
         
         logger.info("Analyse de sentiment des descriptions...")
         
-        def analyser_sentiment(texte):
-            """Analyse le sentiment d'un texte"""
-            try:
-                # Créer un blob de texte
-                blob = TextBlob(str(texte))
-                
-                # Calculer la polarité (-1 à +1)
-                polarite = blob.sentiment.polarity
-                
-                # Classifier
-                if polarite > 0.2:
-                    label = "Positif"
-                elif polarite < -0.2:
-                    label = "Négatif"
-                else:
-                    label = "Neutre"
-                
-                return polarite, label
-            except:
-                return 0.0, "Neutre"
-        
-        sentiments = self.df['Titre'].apply(analyser_sentiment)
-        self.df['Sentiment_Score'] = sentiments.apply(lambda x: round(x[0], 3))
-        self.df['Sentiment_Label'] = sentiments.apply(lambda x: x[1])
-        
-        repartition = self.df['Sentiment_Label'].value_counts()
+        if self._sentiment_en_cours is not None:
+            # Calcul lancé en parallèle du scoring par executer_pipeline_complet
+            codes, polarites = self._sentiment_en_cours
+            self._sentiment_en_cours = None
+        else:
+            codes, a_analyser = _titres_a_analyser(self.df['Titre'])
+            if len(a_analyser) >= SEUIL_SENTIMENT_PARALLELE:
+                with ProcessPoolExecutor(max_workers=NB_WORKERS) as pool:
+                    polarites = list(pool.map(_polarite, a_analyser, chunksize=_taille_lot(len(a_analyser))))
+            else:
+                polarites = map(_polarite, a_analyser)
+        
+        scores, labels = _sentiments(codes, polarites)
+        self._ajouter_colonnes(Sentiment_Score=scores, Sentiment_Label=labels)
+        
+        repartition = pd.Series(labels).value_counts()
         logger.info(f"✓ Sentiments: {repartition.to_dict()}")
     
+    def _lancer_sentiment(self, pool):
+        """
+        Répartit les titres distincts sur les workers pendant que le scoring NumPy
+        continue ; analyser_sentiment_description récupère ensuite les polarités
+        
+        Args:
+            pool (ProcessPoolExecutor): Exécuteur du pipeline
+        """
+        if not TEXTBLOB_AVAILABLE:
+            return
+        codes, a_analyser = _titres_a_analyser(self.df['Titre'])
+        if len(a_analyser) < SEUIL_SENTIMENT_PARALLELE:
+            return  # Peu de titres distincts : démarrer des processus coûterait plus cher
+        # Executor.map soumet tous les lots immédiatement ; l'itérateur est consommé plus tard
+        polarites = pool.map(_polarite, a_analyser, chunksize=_taille_lot(len(a_analyser)))
+        self._sentiment_en_cours = (codes, polarites)
+        logger.info(f"✓ Analyse de sentiment lancée sur {NB_WORKERS} processus")
+    
     def creer_tags_produit(self):
         """
         Crée des tags automatiques pour chaque produit
@@ -310,90 +431,138 @@ class FeatureExtractor:
         """
         logger.info("Création des tags produits...")
         
-        def generer_tags(row):
-            """Génère une liste de tags"""
-            tags = []
-            
+        performance = self._colonne('Performance_Index').astype('float64')
+        reduction = self._ratio('Reduction_Reelle')
+        marque = self.df['Marque'].to_numpy(dtype=object)
+        
+        # Une colonne de tags par règle ('' = pas de tag), dans l'ordre d'affichage
+        colonnes_tags = [
             # Tag de gamme
-            tags.append(row['Gamme'])
-            
+            self.df['Gamme'].to_numpy(dtype=object),
             # Tag de marque
-            if row['Marque'] != 'Autre':
-                tags.append(row['Marque'])
-            
+            np.where(marque != 'Autre', marque, ''),
             # Tag de performance
-            if row['Performance_Index'] >= 80:
-                tags.append("Haute performance")
-            elif row['Performance_Index'] >= 50:
-                tags.append("Performance correcte")
-            
+            np.where(performance >= 80, "Haute performance",
+                     np.where(performance >= 50, "Performance correcte", '')),
             # Tag d'état
-            tags.append(row['Etat_Produit'])
-            
+            self.df['Etat_Produit'].to_numpy(dtype=object),
             # Tag de stockage
-            if row['Type_Stockage'] == 'SSD':
-                tags.append("SSD")
-            
+            np.where(self.df['Type_Stockage'].to_numpy(dtype=object) == 'SSD', "SSD", ''),
             # Tag de bonne affaire
-            if row['Est_Bonne_Affaire']:
-                tags.append("Bonne affaire")
-            
+            np.where(self._colonne('Est_Bonne_Affaire').astype(bool), "Bonne affaire", ''),
             # Tag de promotion
-            if pd.notna(row['Reduction_Reelle']) and row['Reduction_Reelle'] >= 30:
-                tags.append("Promotion")
-            
-            return ", ".join(tags)
+            np.where(reduction >= 30, "Promotion", ''),
+        ]
         
-        self.df['Tags'] = self.df.apply(generer_tags, axis=1)
+        # Concaténation colonne à colonne (str.cat), puis suppression des séparateurs
+        # laissés par les règles vides ('' ou valeur manquante)
+        colonnes_tags = [pd.Series(col, index=self.df.index) for col in colonnes_tags]
+        tags = colonnes_tags[0].str.cat(colonnes_tags[1:], sep=', ', na_rep='')
+        tags = tags.str.replace(r'(?:, )+', ', ', regex=True).str.replace(r'^, |, $', '', regex=True)
+        self._ajouter_colonnes(Tags=tags.to_numpy())
         
         logger.info("✓ Tags générés")
     
-    def sauvegarder_donnees_enrichies(self, output_file='data/processed/enriched_data.csv'):
+    def sauvegarder_donnees_enrichies(self, output_file='data/processed/enriched_data.csv', output_format='csv'):
         """
         Sauvegarde les données enrichies
         
         Args:
             output_file (str): Chemin du fichier de sortie
+            output_format (str): 'csv', ou 'parquet' pour écrire en plus une copie
+                                 Parquet+zstd typée à côté du CSV
         """
         logger.info(f"Sauvegarde des données enrichies...")
         
+        # Toutes les features calculées rejoignent self.df en une seule opération
+        self._appliquer_colonnes()
+        
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        # Le CSV reste écrit : Power BI et les scripts existants le lisent
         self.df.to_csv(output_file, index=False, encoding='utf-8-sig')
         
         logger.info(f"✓ {len(self.df)} produits enrichis sauvegardés dans {output_file}")
+        
+        if output_format == 'parquet':
+            if not PYARROW_AVAILABLE:
+                logger.warning("pyarrow non installé - copie Parquet ignorée")
+                return
+            fichier_parquet = Path(output_file).with_suffix('.parquet')
+            self.df.to_parquet(fichier_parquet, engine='pyarrow', compression='zstd', index=False)
+            logger.info(f"✓ Copie Parquet sauvegardée dans {fichier_parquet}")
+    
+    def _charger_cache(self, output_file):
+        """
+        Recharge les données enrichies si elles sont plus récentes que les données nettoyées
+        
+        Returns:
+            bool: True si le cache a été utilisé
+        """
+        sortie = Path(output_file)
+        entree = Path(self.input_file)
+        if not (sortie.exists() and entree.exists()):
+            return False
+        if sortie.stat().st_mtime < entree.stat().st_mtime:
+            return False
+        
+        moteur = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+        self.df = pd.read_csv(sortie, encoding='utf-8-sig', engine=moteur, dtype=SCHEMA_DONNEES)
+        logger.info(f"✓ Cache valide: {sortie} est plus récent que {entree} ({len(self.df)} produits)")
+        return True
     
-    def executer_pipeline_complet(self):
+    def executer_pipeline_complet(self, output_format='csv', output_file='data/processed/enriched_data.csv',
+                                  force=False):
         """
         Exécute toutes les étapes d'enrichissement
+        
+        Args:
+            output_format (str): Format de sortie transmis à sauvegarder_donnees_enrichies
+            output_file (str): Chemin du fichier enrichi
+            force (bool): Recalcule même si le fichier enrichi est à jour
         """
         logger.info("="*60)
         logger.info("DÉMARRAGE DU PIPELINE D'ENRICHISSEMENT")
         logger.info("="*60)
         
-        etapes = [
-            ("Chargement des données", self.charger_donnees),
-            ("Calcul de la performance", self.calculer_score_performance),
-            ("Calcul du score qualité", self.calculer_score_qualite),
-            ("Calcul rapport qualité/prix", self.calculer_rapport_qualite_prix),
-            ("Détection bonnes affaires", self.detecter_bonnes_affaires),
-            ("Détection anomalies prix", self.detecter_anomalies_prix),
-            ("Analyse de sentiment", self.analyser_sentiment_description),
-            ("Création des tags", self.creer_tags_produit),
-            ("Sauvegarde", self.sauvegarder_donnees_enrichies)
-        ]
-        
-        for i, (nom, fonction) in enumerate(etapes, 1):
-            logger.info(f"\n[{i}/{len(etapes)}] {nom}...")
+        if not force:
             try:
-                resultat = fonction()
-                if resultat is False:
-                    logger.error(f"✗ Échec de l'étape: {nom}")
-                    return False
+                if self._charger_cache(output_file):
+                    logger.info("Pipeline ignoré (utilisez force=True pour recalculer)")
+                    return True
             except Exception as e:
-                logger.error(f"✗ Erreur dans {nom}: {e}")
-                import traceback
-                traceback.print_exc()
-                return False
+                logger.warning(f"⚠ Cache illisible, recalcul complet: {e}")
+        
+        # Le sentiment (TextBlob, Python pur) ne dépend que des titres : il tourne sur
+        # des processus à part pendant le scoring, et est récupéré avant les tags
+        with ProcessPoolExecutor(max_workers=NB_WORKERS) as pool:
+            etapes = [
+                ("Chargement des données", self.charger_donnees),
+                ("Préparation des colonnes", self._prepare_columns),
+                ("Lancement de l'analyse de sentiment", lambda: self._lancer_sentiment(pool)),
+                ("Calcul de la performance", self.calculer_score_performance),
+                ("Calcul du score qualité", self.calculer_score_qualite),
+                ("Calcul rapport qualité/prix", self.calculer_rapport_qualite_prix),
+                ("Détection bonnes affaires", self.detecter_bonnes_affaires),
+                ("Détection anomalies prix", self.detecter_anomalies_prix),
+                ("Analyse de sentiment", self.analyser_sentiment_description),
+                ("Création des tags", self.creer_tags_produit),
+                ("Sauvegarde", lambda: self.sauvegarder_donnees_enrichies(output_file, output_format))
+            ]
+            
+            for i, (nom, fonction) in enumerate(etapes, 1):
+                logger.info(f"\n[{i}/{len(etapes)}] {nom}...")
+                try:
+                    resultat = fonction()
+                    if resultat is False:
+                        logger.error(f"✗ Échec de l'étape: {nom}")
+                        return False
+                except Exception as e:
+                    logger.error(f"✗ Erreur dans {nom}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    return False
+        
+        self._appliquer_colonnes()
         
         logger.info("\n" + "="*60)
         logger.info("✓ PIPELINE D'ENRICHISSEMENT TERMINÉ")
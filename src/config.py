@@ -17,6 +17,7 @@ LOGS_DIR = PROJECT_ROOT / "logs"
 
 # --- FICHIERS DE DONNÉES ---
 RAW_DATA_FILE = RAW_DATA_DIR / "raw_data.csv"
+RAW_PARTIAL_FILE = RAW_DATA_DIR / "raw_data.partiel.csv"  # Produits écrits page par page pendant le scraping
 CLEANED_DATA_FILE = PROCESSED_DATA_DIR / "cleaned_data.csv"
 ANALYSIS_REPORT_FILE = REPORTS_DIR / "analysis_report.csv"
 
@@ -24,9 +25,12 @@ ANALYSIS_REPORT_FILE = REPORTS_DIR / "analysis_report.csv"
 RPA_CONFIG = {
     "url_base": "https://www.jumia.ma/catalog/?q=ordinateur+portable",
     "pages_a_scraper": 5,  # Nombre de pages à parcourir (plus de volume)
-    "delai_entre_pages": 4,  # Secondes entre chaque page (plus respectueux)
+    "delai_entre_pages": 4,  # Secondes minimum entre deux débuts de page, même en parallèle (plus respectueux)
     "timeout": 20,  # Timeout augmenté pour éviter les échecs
     "retry_count": 2,  # Nombre de tentatives par page
+    "pages_en_parallele": 4,  # Pages récupérées en même temps (chemin HTTP)
+    "navigateurs_en_reserve": 1,  # Chrome gardés ouverts entre deux exécutions (même processus)
+    "processus_selenium": 4,  # Chrome lancés en parallèle, un par processus (repli Selenium)
     "headless": False,  # True = navigateur invisible, False = visible pour debug
     "source_name": "Jumia"
 }
@@ -3,12 +3,34 @@ DatabaseManager - Classe pour gérer la base de données SQLite
 Author: Membre 3 - Database Architect
 """
 
+import csv
 import sqlite3
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 from typing import Dict
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# requests (optionnel) : CSV distants lus via une session à connexions réutilisées
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
 # ============================================================
 # 📌 Détection automatique de la racine du projet
 # ============================================================
@@ -16,15 +38,284 @@ from datetime import datetime
 # Racine  : SmartMarketWatch/
 BASE_DIR = Path(__file__).resolve().parents[2]
 
+# Nombre de lignes envoyées par appel à executemany
+TAILLE_LOT = 10_000
+
+# Lignes du CSV lues et insérées à la fois (mémoire bornée par bloc, pas par fichier)
+TAILLE_BLOC_CSV = 100_000
+
+# Taille des blocs d'octets analysés à la fois par le lecteur CSV Arrow
+TAILLE_BLOC_ARROW = 8 << 20
+
+# Lignes regroupées dans un même INSERT ... VALUES (...), (...)
+LIGNES_PAR_REQUETE = 500
+
+# Scalaires NumPy liés comme entiers / réels SQLite : sans adaptateur, un np.float32
+# ou un np.bool_ serait stocké en BLOB de ses octets bruts (NaN reste NULL)
+for _type in (np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.bool_):
+    sqlite3.register_adapter(_type, int)
+for _type in (np.float16, np.float32, np.float64):
+    sqlite3.register_adapter(_type, float)
+del _type
+
+# Requêtes préparées gardées par connexion (INSERT multi-lignes de chaque taille compris)
+REQUETES_EN_CACHE = 256
+
+# Réglages appliqués à chaque connexion : journal WAL (un seul fsync par checkpoint),
+# tables temporaires en mémoire, cache de 256 Mo et fichier mappé en mémoire (1 Go)
+PRAGMAS_CONNEXION = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-262144",
+    "mmap_size=1073741824",
+)
+
+# Colonnes du CSV de chaque table, dans l'ordre des INSERT, avec leur valeur quand
+# le fichier ne les contient pas (les valeurs manquantes restent NULL)
+COLONNES_PRODUITS = [
+    ("Titre", ""), ("Image_URL", ""), ("Resume_Produit", ""),
+    ("Keywords_TFIDF", ""), ("Gamme", ""),
+]
+COLONNES_SPECIFICATIONS = [
+    ("CPU", ""), ("Generation_CPU", None), ("RAM_GB", None), ("RAM_Type", ""),
+    ("RAM_Frequence", None), ("Stockage_Total_GB", None), ("Type_Stockage", ""),
+    ("Stockage_SSD_GB", None), ("Stockage_HDD_GB", None), ("Stockage_NVMe", False),
+    ("Ecran_Taille", None), ("Ecran_Resolution_Width", None),
+    ("Ecran_Resolution_Height", None), ("Ecran_Type", ""), ("Ecran_Tactile", False),
+    ("GPU_Marque", ""), ("GPU_Serie", ""), ("GPU_Modele", ""), ("WiFi_Version", ""),
+    ("Bluetooth_Version", ""), ("USB_Type", ""), ("Batterie_Capacite", None),
+    ("Batterie_Autonomie", None),
+]
+COLONNES_QUALITE = [
+    ("Etat_Produit", ""), ("Taux_Completude", None), ("Sentiment_BERT", ""),
+    ("Sentiment_Score_BERT", None), ("Anomalie_Prix_ZScore", False),
+    ("Anomalie_Prix_IQR", False), ("Type_Anomalie_Prix", ""), ("Anomalie_ML", False),
+    ("Produit_Suspect", False), ("Raisons_Suspicion", ""), ("Recommandation_Achat", ""),
+]
+COLONNES_MESURES = [
+    ("Prix_Actuel_Clean", None), ("Ancien_Prix_Clean", None),
+    ("Reduction_Reelle", None), ("Discount", None), ("Rating_Clean", None),
+    ("Rating", None), ("Sentiment_Score_BERT", None), ("Anomalie_Score_ML", None),
+    ("Anomalie_Score_Normalized", None), ("Incoherence_Spec_Prix", None),
+    ("Severite_Incoherence", None), ("Indice_Confiance", None),
+    ("Score_Fiabilite_Vendeur", None), ("Date_Collecte", None),
+]
+
+# Requêtes d'insertion, construites une fois à l'import
+SQL_DIM_MARQUES = "INSERT INTO Dim_Marques (nom_marque) VALUES (?)"
+SQL_DIM_SOURCES = "INSERT INTO Dim_Sources (nom_source) VALUES (?)"
+SQL_DIM_DATES = """
+INSERT OR IGNORE INTO Dim_Dates
+(date_id, date_complete, annee, mois, jour, trimestre, jour_semaine)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_DIM_PRODUITS = """
+INSERT INTO Dim_Produits (titre, image_url, resume_produit, keywords_tfidf, gamme)
+VALUES (?, ?, ?, ?, ?)
+"""
+SQL_DIM_SPECIFICATIONS = """
+INSERT INTO Dim_Specifications
+(cpu, generation_cpu, ram_gb, ram_type, ram_frequence,
+ stockage_total_gb, type_stockage, stockage_ssd_gb, stockage_hdd_gb,
+ stockage_nvme, ecran_taille, ecran_resolution_width, ecran_resolution_height,
+ ecran_type, ecran_tactile, gpu_marque, gpu_serie, gpu_modele,
+ wifi_version, bluetooth_version, usb_type, batterie_capacite, batterie_autonomie)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_DIM_QUALITE = """
+INSERT INTO Dim_Qualite
+(etat_produit, taux_completude, sentiment_bert, sentiment_score_bert,
+ anomalie_prix_zscore, anomalie_prix_iqr, type_anomalie_prix,
+ anomalie_ml, produit_suspect, raisons_suspicion, recommandation_achat)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+COLONNES_FACT = [
+    "produit_id", "marque_id", "date_id", "source_id", "spec_id", "qualite_id",
+    "prix_actuel", "ancien_prix", "reduction_reelle", "discount_affiche",
+    "rating_score", "rating_text", "sentiment_score",
+    "anomalie_score_ml", "anomalie_score_normalized",
+    "incoherence_spec_prix", "severite_incoherence",
+    "indice_confiance", "score_fiabilite_vendeur", "date_collecte",
+]
+
+# Colonnes booléennes stockées en 0/1
+DRAPEAUX_SPECIFICATIONS = ["Stockage_NVMe", "Ecran_Tactile"]
+DRAPEAUX_QUALITE = ["Anomalie_Prix_ZScore", "Anomalie_Prix_IQR", "Anomalie_ML", "Produit_Suspect"]
+
+# Colonnes du CSV stockées en REAL/INTEGER. Le lecteur Arrow en flux ne déduirait les
+# types que de son premier bloc (une colonne vide au début serait typée null, puis
+# rejetée plus loin) : ces colonnes sont lues en réels, les drapeaux en booléens et
+# toutes les autres en texte.
+COLONNES_NUMERIQUES = [
+    "Generation_CPU", "RAM_GB", "RAM_Frequence", "Stockage_Total_GB", "Stockage_SSD_GB",
+    "Stockage_HDD_GB", "Ecran_Taille", "Ecran_Resolution_Width", "Ecran_Resolution_Height",
+    "Batterie_Capacite", "Batterie_Autonomie", "Taux_Completude", "Sentiment_Score_BERT",
+    "Prix_Actuel_Clean", "Ancien_Prix_Clean", "Reduction_Reelle", "Rating_Clean",
+    "Anomalie_Score_ML", "Anomalie_Score_Normalized", "Severite_Incoherence",
+    "Indice_Confiance", "Score_Fiabilite_Vendeur",
+]
+
+# Nombre de lignes de chaque table en une seule requête
+TABLES_STATS = [
+    "Dim_Marques",
+    "Dim_Sources",
+    "Dim_Dates",
+    "Dim_Produits",
+    "Dim_Specifications",
+    "Dim_Qualite",
+    "FACT_Ventes",
+]
+STATS_SQL = " UNION ALL ".join(f"SELECT '{t}', COUNT(*) FROM {t}" for t in TABLES_STATS)
+
+
+def _colonnes(df: pd.DataFrame, colonnes) -> pd.DataFrame:
+    """
+    Sous-tableau des colonnes à insérer, dans l'ordre de la requête.
+    `colonnes` est une liste de (nom, défaut) : comme row.get(nom, défaut),
+    le défaut ne remplace que les colonnes absentes du CSV.
+    """
+    return pd.DataFrame(
+        {nom: df[nom] if nom in df.columns else defaut for nom, defaut in colonnes},
+        index=df.index,
+    )
+
+
+def _ids_par_code(serie: pd.Series, ids: dict) -> pd.Series:
+    """
+    Clé étrangère de chaque ligne via les codes d'un Categorical : une table des IDs
+    indexée par code, le None final étant lu par le code -1 (valeur inconnue ou manquante)
+    """
+    codes = pd.Categorical(serie, categories=list(ids)).codes
+    table = np.array(list(ids.values()) + [None], dtype=object)
+    return pd.Series(table[codes], index=serie.index)
+
+
+def _cles_dates(dates: pd.Series) -> pd.Series:
+    """Clé de Dim_Dates (entier AAAAMMJJ) de chaque date, None si la date manque"""
+    cles = dates.dt.year * 10000 + dates.dt.month * 100 + dates.dt.day
+    return cles.astype("Int64").astype(object).where(cles.notna(), None)
+
+
+def _drapeaux(lignes: pd.DataFrame, colonnes) -> None:
+    """
+    Convertit sur place les colonnes booléennes en int8, comme int(bool(x)).
+    Une valeur manquante (NaN, ou None venant d'Arrow) compte comme vraie ;
+    les colonnes absentes du CSV reçoivent False via _colonnes. Les colonnes
+    numériques sont comparées à 0 en un seul bloc NumPy ; les autres passent par bool().
+    """
+    numeriques = [c for c in colonnes if pd.api.types.is_numeric_dtype(lignes[c])]
+    if numeriques:
+        bloc = lignes[numeriques].to_numpy(dtype="float64", na_value=np.nan)
+        lignes[numeriques] = (bloc != 0).astype(np.int8)
+    for col in colonnes:
+        if col not in numeriques:
+            serie = lignes[col]
+            lignes[col] = serie.map(bool).mask(serie.isna(), True).astype(np.int8)
+
+
+@lru_cache(maxsize=1)
+def _session_http():
+    """
+    Session partagée par tous les téléchargements de CSV (créée au premier) : connexions
+    gardées ouvertes, erreurs transitoires (connexion, 429, 5xx) rejouées avec attente croissante.
+    """
+    session = requests.Session()
+    adaptateur = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount("http://", adaptateur)
+    session.mount("https://", adaptateur)
+    return session
+
+
+@contextmanager
+def _ouvrir_csv(csv_path: str | Path):
+    """
+    Source à passer aux lecteurs CSV : le chemin local tel quel, ou pour une URL http(s)
+    le flux de la réponse (lu au fil de l'eau, sans fichier temporaire). Sans requests,
+    l'URL est laissée aux lecteurs, qui l'ouvrent eux-mêmes.
+    """
+    if not (REQUESTS_AVAILABLE and str(csv_path).startswith(("http://", "https://"))):
+        yield csv_path
+        return
+    with _session_http().get(str(csv_path), stream=True, timeout=(5, 60)) as reponse:
+        reponse.raise_for_status()
+        reponse.raw.decode_content = True  # gzip/deflate éventuels décompressés à la lecture
+        yield reponse.raw
+
+
+def _lire_csv_par_blocs(csv_path: str | Path, chunksize: int):
+    """
+    Blocs successifs du CSV en DataFrames, index continu d'un bloc à l'autre.
+    Avec pyarrow, le fichier est lu en flux par blocs d'octets Arrow (analyse multi-thread,
+    mémoire bornée par le bloc) ; sinon lecteur pandas par morceaux.
+    """
+    with _ouvrir_csv(csv_path) as source:
+        if not PYARROW_AVAILABLE:
+            yield from pd.read_csv(source, encoding="utf-8", chunksize=chunksize)
+            return
+        with open(source, "rb") if isinstance(source, (str, Path)) else nullcontext(source) as flux:
+            yield from _blocs_arrow(flux, chunksize)
+
+
+def _blocs_arrow(flux, chunksize: int):
+    """
+    Lit le flux binaire avec pa_csv.open_csv et regroupe ses RecordBatch en DataFrames
+    de `chunksize` lignes, convertis au fur et à mesure de l'analyse. L'en-tête est lu ici
+    pour typer explicitement chaque colonne (voir COLONNES_NUMERIQUES).
+    """
+    entete = next(csv.reader([flux.readline().decode("utf-8-sig")]), [])
+    drapeaux = set(DRAPEAUX_SPECIFICATIONS + DRAPEAUX_QUALITE)
+    types = {
+        nom: pa.float64() if nom in COLONNES_NUMERIQUES else pa.bool_() if nom in drapeaux else pa.string()
+        for nom in entete
+    }
+    lecteur = pa_csv.open_csv(
+        flux,
+        read_options=pa_csv.ReadOptions(block_size=TAILLE_BLOC_ARROW, column_names=entete),
+        convert_options=pa_csv.ConvertOptions(column_types=types, strings_can_be_null=True),
+    )
+    debut, lots, lignes = 0, [], 0
+    # None final : vide le dernier bloc, plus court que chunksize
+    for lot in chain(lecteur, [None]):
+        if lot is not None:
+            lots.append(lot)
+            lignes += lot.num_rows
+        while lignes >= chunksize or (lot is None and lignes):
+            table = pa.Table.from_batches(lots)
+            bloc = table.slice(0, chunksize).to_pandas()
+            bloc.index = pd.RangeIndex(debut, debut + len(bloc))
+            yield bloc
+            debut += len(bloc)
+            reste = table.slice(len(bloc))
+            lots, lignes = reste.to_batches(), reste.num_rows
+
+
+def _en_avance(blocs):
+    """
+    Itère sur `blocs` en préparant l'élément suivant dans un thread pendant que
+    l'appelant traite le courant : lecture et analyse du CSV recouvrent les écritures
+    SQLite (qui relâchent le GIL), la connexion restant utilisée par un seul thread.
+    """
+    blocs = iter(blocs)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        suivant = executor.submit(next, blocs, None)
+        while (bloc := suivant.result()) is not None:
+            suivant = executor.submit(next, blocs, None)
+            yield bloc
+
 
 class DatabaseManager:
     """Gestionnaire de la base de données SmartMarketWatch"""
 
-    def __init__(self, db_path: Path | None = None):
+    def __init__(self, db_path: str | Path | None = None):
         """
         Initialise le gestionnaire de base de données (chemin relatif)
         """
-        self.db_path = db_path or (BASE_DIR / "data" / "smartmarketwatch.db")
+        self.db_path = Path(db_path) if db_path else BASE_DIR / "data" / "smartmarketwatch.db"
 
         # Créer le dossier data/ si inexistant
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -37,25 +328,135 @@ class DatabaseManager:
         self.sources_dict = {}
         self.dates_dict = {}
 
+        # Lignes de dimension déjà insérées (valeurs de la ligne -> ID), pour ne pas les répéter
+        self.produits_dict = {}
+        self.specs_dict = {}
+        self.qualite_dict = {}
+
     # ============================================================
     # 🔌 Connexion DB
     # ============================================================
     def connect(self):
-        self.conn = sqlite3.connect(self.db_path)
+        # Autocommit : seules les transactions explicites de _transaction regroupent les écritures ;
+        # cache de requêtes préparées assez grand pour toutes les requêtes de l'import
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=REQUETES_EN_CACHE)
         self.conn.execute("PRAGMA foreign_keys = ON")
+        for pragma in PRAGMAS_CONNEXION:
+            self.conn.execute(f"PRAGMA {pragma}")
         self.cursor = self.conn.cursor()
         print(f"✅ Connecté à {self.db_path}")
 
+    @contextmanager
+    def bulk_load(self):
+        """
+        Réglages d'import massif le temps du bloc : ni fsync ni journal sur disque.
+        Une coupure pendant l'import peut corrompre la base, qui se reconstruit
+        alors depuis le CSV ; les réglages de PRAGMAS_CONNEXION sont rétablis à la sortie.
+        """
+        self.conn.commit()
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("PRAGMA journal_mode=MEMORY")
+        try:
+            yield self
+        finally:
+            self.conn.commit()
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+
     def disconnect(self):
         if self.conn:
             self.conn.commit()
             self.conn.close()
             print("✅ Connexion fermée")
 
+    # ============================================================
+    # 🔁 Transactions
+    # ============================================================
+    @contextmanager
+    def _transaction(self, immediate: bool = False):
+        """
+        Regroupe les insertions d'une étape dans une seule transaction explicite
+        (immediate=True : verrou d'écriture pris dès le BEGIN). Annulée sur toute
+        interruption, Ctrl-C compris : la connexion ne reste jamais dans une transaction ouverte.
+        """
+        self.cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _executemany_par_lots(self, sql: str, lignes):
+        """executemany par lots de TAILLE_LOT tuples (mémoire bornée)"""
+        lignes = iter(lignes)
+        while lot := list(islice(lignes, TAILLE_LOT)):
+            self.cursor.executemany(sql, lot)
+
+    def _inserer_avec_ids(self, table: str, sql: str, lignes: pd.DataFrame) -> dict:
+        """
+        executemany sur une table AUTOINCREMENT, avec l'ID de chaque ligne.
+        Sous verrou d'écriture, SQLite attribue des rowid consécutifs à partir du
+        plus grand rowid déjà utilisé : les IDs se déduisent de ce point de départ.
+
+        Returns:
+            dict: index de `lignes` -> ID inséré
+        """
+        n = len(lignes)
+        if n == 0:
+            return {}
+        with self._transaction(immediate=True):
+            base = self.cursor.execute(
+                f"""
+                SELECT MAX(IFNULL((SELECT MAX(rowid) FROM {table}), 0),
+                           IFNULL((SELECT seq FROM sqlite_sequence WHERE name = ?), 0))
+                """,
+                (table,),
+            ).fetchone()[0]
+            self._executemany_par_lots(sql, lignes.itertuples(index=False, name=None))
+            dernier = self.cursor.execute(f"SELECT MAX(rowid) FROM {table}").fetchone()[0]
+            if dernier != base + n:
+                raise RuntimeError(f"IDs non consécutifs dans {table} ({base} + {n} != {dernier})")
+        return dict(zip(lignes.index, range(base + 1, base + n + 1)))
+
+    def _inserer_uniques(self, table: str, sql: str, lignes: pd.DataFrame, connus: dict) -> pd.Series:
+        """
+        Insère une seule fois chaque ligne distincte de `lignes` (toutes colonnes
+        comparées, valeurs manquantes égales entre elles), y compris d'un bloc CSV
+        à l'autre grâce à `connus`, complété au passage.
+
+        Returns:
+            pd.Series: ID de la ligne de dimension, pour chaque ligne de `lignes`
+        """
+        cles = pd.Series(
+            list(lignes.astype(object).where(lignes.notna(), None).itertuples(index=False, name=None)),
+            index=lignes.index,
+        )
+        nouvelles = ~cles.duplicated() & ~cles.map(connus.__contains__)
+        mapping = self._inserer_avec_ids(table, sql, lignes[nouvelles])
+        connus.update(zip(cles[nouvelles], mapping.values()))
+        return pd.Series([connus[cle] for cle in cles], index=lignes.index, dtype=object)
+
+    def _inserer_multi(self, table: str, colonnes: list, lignes):
+        """
+        INSERT multi-lignes : jusqu'à LIGNES_PAR_REQUETE lignes par requête,
+        dans la limite de variables liées de SQLite
+        """
+        limite = self.conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) if hasattr(self.conn, "getlimit") else 999
+        par_requete = max(1, min(LIGNES_PAR_REQUETE, limite // len(colonnes)))
+        tuple_sql = "(" + ", ".join("?" * len(colonnes)) + ")"
+        debut_sql = f"INSERT INTO {table} ({', '.join(colonnes)}) VALUES "
+        sql_complet = debut_sql + ", ".join([tuple_sql] * par_requete)
+
+        lignes = iter(lignes)
+        while lot := list(islice(lignes, par_requete)):
+            sql = sql_complet if len(lot) == par_requete else debut_sql + ", ".join([tuple_sql] * len(lot))
+            self.cursor.execute(sql, [valeur for ligne in lot for valeur in ligne])
+
     # ============================================================
     # 🧱 Création du schéma
     # ============================================================
-    def create_schema(self, schema_path: Path | None = None):
+    def create_schema(self, schema_path: str | Path | None = None):
         schema_path = schema_path or (BASE_DIR / "src" / "database" / "schema.sql")
 
         print("\n🔧 Création de la structure de la base de données...")
@@ -71,236 +472,172 @@ class DatabaseManager:
     # ============================================================
     # 📂 Chargement CSV
     # ============================================================
-    def load_csv_data(self, csv_path: Path):
+    def load_csv_data(self, csv_path: str | Path, chunksize: int = TAILLE_BLOC_CSV):
         print(f"\n📂 Chargement du CSV: {csv_path}")
 
-        df = pd.read_csv(csv_path, encoding="utf-8")
-        print(f"✅ {len(df)} lignes chargées")
+        # Chaque bloc passe par toutes les tables avant la lecture du suivant ; les
+        # dictionnaires, lus une fois en base puis complétés, gardent les dimensions uniques
+        self._charger_dictionnaires()
+        self.produits_dict, self.specs_dict, self.qualite_dict = {}, {}, {}
+        # Date_Collecte analysée une seule fois par bloc, dans le thread de lecture
+        blocs = (
+            (df, pd.to_datetime(df["Date_Collecte"], errors="coerce"))
+            for df in _lire_csv_par_blocs(csv_path, chunksize)
+        )
+        with self._sans_index():
+            for df, dates in _en_avance(blocs):
+                print(f"✅ {len(df)} lignes chargées")
+                self._charger_bloc(df, dates)
 
+        print("\n✅ Données chargées avec succès !")
+
+    @contextmanager
+    def _sans_index(self):
+        """
+        Supprime les index secondaires le temps de l'import puis les recrée (même en
+        cas d'erreur) : un tri par index en fin de chargement coûte moins que leur
+        mise à jour à chaque INSERT. Les index des contraintes UNIQUE, sans SQL propre
+        dans sqlite_master, sont conservés.
+        """
+        self.cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+        index = self.cursor.fetchall()
+        with self._transaction(immediate=True):
+            for nom, _ in index:
+                self.cursor.execute(f'DROP INDEX "{nom}"')
+        try:
+            yield
+        finally:
+            print(f"🔄 Reconstruction de {len(index)} index...")
+            # Transaction laissée ouverte par une interruption : annulée, sans quoi le
+            # BEGIN ci-dessous échouerait et la suppression des index deviendrait définitive
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            with self._transaction(immediate=True):
+                for _, sql in index:
+                    self.cursor.execute(sql)
+
+    def _charger_dictionnaires(self):
+        """Marques, sources et dates déjà en base : seule lecture de ces tables pendant l'import"""
+        self.cursor.execute("SELECT nom_marque, marque_id FROM Dim_Marques")
+        self.marques_dict = dict(self.cursor.fetchall())
+        self.cursor.execute("SELECT nom_source, source_id FROM Dim_Sources")
+        self.sources_dict = dict(self.cursor.fetchall())
+        self.cursor.execute("SELECT date_complete, date_id FROM Dim_Dates")
+        self.dates_dict = dict(self.cursor.fetchall())
+
+    def _charger_bloc(self, df: pd.DataFrame, dates: pd.Series):
+        # Dates partagées par Dim_Dates et FACT_Ventes
         self._populate_dim_marques(df)
         self._populate_dim_sources(df)
-        self._populate_dim_dates(df)
-
-        produits_dict = self._populate_dim_produits(df)
-        specs_dict = self._populate_dim_specifications(df)
-        qualite_dict = self._populate_dim_qualite(df)
+        self._populate_dim_dates(dates)
 
-        self._populate_fact_ventes(df, produits_dict, specs_dict, qualite_dict)
+        produits = self._populate_dim_produits(df)
+        specs = self._populate_dim_specifications(df)
+        qualites = self._populate_dim_qualite(df)
 
-        print("\n✅ Données chargées avec succès !")
+        self._populate_fact_ventes(df, dates, produits, specs, qualites)
 
     # ============================================================
     # 📊 Dimensions
     # ============================================================
     def _populate_dim_marques(self, df):
         print("🔄 Remplissage Dim_Marques...")
-        for marque in df["Marque"].dropna().unique():
-            self.cursor.execute(
-                "INSERT OR IGNORE INTO Dim_Marques (nom_marque) VALUES (?)",
-                (marque,),
-            )
-        self.conn.commit()
-        self.cursor.execute("SELECT marque_id, nom_marque FROM Dim_Marques")
-        self.marques_dict = {m: i for i, m in self.cursor.fetchall()}
+        # Seules les nouvelles valeurs sont insérées ; leurs IDs complètent le dictionnaire
+        lignes = pd.DataFrame({"nom_marque": [m for m in df["Marque"].dropna().unique() if m not in self.marques_dict]})
+        mapping = self._inserer_avec_ids("Dim_Marques", SQL_DIM_MARQUES, lignes)
+        self.marques_dict.update(zip(lignes["nom_marque"], mapping.values()))
         print(f"✅ {len(self.marques_dict)} marques insérées")
 
     def _populate_dim_sources(self, df):
         print("🔄 Remplissage Dim_Sources...")
-        for source in df["Source"].dropna().unique():
-            self.cursor.execute(
-                "INSERT OR IGNORE INTO Dim_Sources (nom_source) VALUES (?)",
-                (source,),
-            )
-        self.conn.commit()
-        self.cursor.execute("SELECT source_id, nom_source FROM Dim_Sources")
-        self.sources_dict = {s: i for i, s in self.cursor.fetchall()}
+        lignes = pd.DataFrame({"nom_source": [s for s in df["Source"].dropna().unique() if s not in self.sources_dict]})
+        mapping = self._inserer_avec_ids("Dim_Sources", SQL_DIM_SOURCES, lignes)
+        self.sources_dict.update(zip(lignes["nom_source"], mapping.values()))
         print(f"✅ {len(self.sources_dict)} sources insérées")
 
-    def _populate_dim_dates(self, df):
+    def _populate_dim_dates(self, dates: pd.Series):
         print("🔄 Remplissage Dim_Dates...")
         jours = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
 
-        for date in pd.to_datetime(df["Date_Collecte"]).dropna().unique():
-            d = pd.Timestamp(date)
-            self.cursor.execute(
-                """
-                INSERT OR IGNORE INTO Dim_Dates
-                (date_id, date_complete, annee, mois, jour, trimestre, jour_semaine)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    int(d.strftime("%Y%m%d")),
-                    d.strftime("%Y-%m-%d"),
-                    d.year,
-                    d.month,
-                    d.day,
-                    (d.month - 1) // 3 + 1,
-                    jours[d.dayofweek],
-                ),
-            )
-        self.conn.commit()
-        self.cursor.execute("SELECT date_id, date_complete FROM Dim_Dates")
-        self.dates_dict = {d: i for i, d in self.cursor.fetchall()}
+        # Une ligne par jour distinct, attributs calculés colonne par colonne
+        d = dates.dropna().dt.normalize().drop_duplicates()
+        lignes = pd.DataFrame({
+            "date_id": _cles_dates(d),
+            "date_complete": d.dt.strftime("%Y-%m-%d"),
+            "annee": d.dt.year,
+            "mois": d.dt.month,
+            "jour": d.dt.day,
+            "trimestre": d.dt.quarter,
+            "jour_semaine": d.dt.dayofweek.map(dict(enumerate(jours))),
+        })
+        lignes = lignes[~lignes["date_complete"].isin(list(self.dates_dict))]
+        with self._transaction():
+            self.cursor.executemany(SQL_DIM_DATES, lignes.itertuples(index=False, name=None))
+        self.dates_dict.update(zip(lignes["date_complete"], lignes["date_id"]))
         print(f"✅ {len(self.dates_dict)} dates insérées")
 
     def _populate_dim_produits(self, df):
         print("🔄 Remplissage Dim_Produits...")
-        mapping = {}
-        for idx, row in df.iterrows():
-            self.cursor.execute(
-                """
-                INSERT INTO Dim_Produits (titre, image_url, resume_produit, keywords_tfidf, gamme)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("Titre", ""),
-                    row.get("Image_URL", ""),
-                    row.get("Resume_Produit", ""),
-                    row.get("Keywords_TFIDF", ""),
-                    row.get("Gamme", ""),
-                ),
-            )
-            mapping[idx] = self.cursor.lastrowid
-        self.conn.commit()
-        print(f"✅ {len(mapping)} produits insérés")
-        return mapping
+        lignes = _colonnes(df, COLONNES_PRODUITS)
+        avant = len(self.produits_dict)
+        ids = self._inserer_uniques("Dim_Produits", SQL_DIM_PRODUITS, lignes, self.produits_dict)
+        print(f"✅ {len(self.produits_dict) - avant} produits insérés")
+        return ids
 
     def _populate_dim_specifications(self, df):
         print("🔄 Remplissage Dim_Specifications...")
-        mapping = {}
-        for idx, row in df.iterrows():
-            self.cursor.execute(
-                """
-                INSERT INTO Dim_Specifications
-                (cpu, generation_cpu, ram_gb, ram_type, ram_frequence,
-                 stockage_total_gb, type_stockage, stockage_ssd_gb, stockage_hdd_gb,
-                 stockage_nvme, ecran_taille, ecran_resolution_width, ecran_resolution_height,
-                 ecran_type, ecran_tactile, gpu_marque, gpu_serie, gpu_modele,
-                 wifi_version, bluetooth_version, usb_type, batterie_capacite, batterie_autonomie)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("CPU", ""),
-                    row.get("Generation_CPU"),
-                    row.get("RAM_GB"),
-                    row.get("RAM_Type", ""),
-                    row.get("RAM_Frequence"),
-                    row.get("Stockage_Total_GB"),
-                    row.get("Type_Stockage", ""),
-                    row.get("Stockage_SSD_GB"),
-                    row.get("Stockage_HDD_GB"),
-                    int(bool(row.get("Stockage_NVMe"))),
-                    row.get("Ecran_Taille"),
-                    row.get("Ecran_Resolution_Width"),
-                    row.get("Ecran_Resolution_Height"),
-                    row.get("Ecran_Type", ""),
-                    int(bool(row.get("Ecran_Tactile"))),
-                    row.get("GPU_Marque", ""),
-                    row.get("GPU_Serie", ""),
-                    row.get("GPU_Modele", ""),
-                    row.get("WiFi_Version", ""),
-                    row.get("Bluetooth_Version", ""),
-                    row.get("USB_Type", ""),
-                    row.get("Batterie_Capacite"),
-                    row.get("Batterie_Autonomie"),
-                ),
-            )
-            mapping[idx] = self.cursor.lastrowid
-        self.conn.commit()
-        print(f"✅ {len(mapping)} spécifications insérées")
-        return mapping
+        lignes = _colonnes(df, COLONNES_SPECIFICATIONS)
+        _drapeaux(lignes, DRAPEAUX_SPECIFICATIONS)
+        avant = len(self.specs_dict)
+        ids = self._inserer_uniques("Dim_Specifications", SQL_DIM_SPECIFICATIONS, lignes, self.specs_dict)
+        print(f"✅ {len(self.specs_dict) - avant} spécifications insérées")
+        return ids
 
     def _populate_dim_qualite(self, df):
         print("🔄 Remplissage Dim_Qualite...")
-        mapping = {}
-        for idx, row in df.iterrows():
-            self.cursor.execute(
-                """
-                INSERT INTO Dim_Qualite
-                (etat_produit, taux_completude, sentiment_bert, sentiment_score_bert,
-                 anomalie_prix_zscore, anomalie_prix_iqr, type_anomalie_prix,
-                 anomalie_ml, produit_suspect, raisons_suspicion, recommandation_achat)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("Etat_Produit", ""),
-                    row.get("Taux_Completude"),
-                    row.get("Sentiment_BERT", ""),
-                    row.get("Sentiment_Score_BERT"),
-                    int(bool(row.get("Anomalie_Prix_ZScore"))),
-                    int(bool(row.get("Anomalie_Prix_IQR"))),
-                    row.get("Type_Anomalie_Prix", ""),
-                    int(bool(row.get("Anomalie_ML"))),
-                    int(bool(row.get("Produit_Suspect"))),
-                    row.get("Raisons_Suspicion", ""),
-                    row.get("Recommandation_Achat", ""),
-                ),
-            )
-            mapping[idx] = self.cursor.lastrowid
-        self.conn.commit()
-        print(f"✅ {len(mapping)} entrées qualité insérées")
-        return mapping
-
-    def _populate_fact_ventes(self, df, produits, specs, qualites):
+        lignes = _colonnes(df, COLONNES_QUALITE)
+        _drapeaux(lignes, DRAPEAUX_QUALITE)
+        avant = len(self.qualite_dict)
+        ids = self._inserer_uniques("Dim_Qualite", SQL_DIM_QUALITE, lignes, self.qualite_dict)
+        print(f"✅ {len(self.qualite_dict) - avant} entrées qualité insérées")
+        return ids
+
+    def _populate_fact_ventes(self, df, dates: pd.Series, produits, specs, qualites):
         print("🔄 Remplissage FACT_Ventes...")
-        for idx, row in df.iterrows():
-            date = pd.to_datetime(row.get("Date_Collecte"))
-            date_id = self.dates_dict.get(date.strftime("%Y-%m-%d")) if pd.notna(date) else None
-
-            self.cursor.execute(
-                """
-                INSERT INTO FACT_Ventes
-                (produit_id, marque_id, date_id, source_id, spec_id, qualite_id,
-                 prix_actuel, ancien_prix, reduction_reelle, discount_affiche,
-                 rating_score, rating_text, sentiment_score,
-                 anomalie_score_ml, anomalie_score_normalized,
-                 incoherence_spec_prix, severite_incoherence,
-                 indice_confiance, score_fiabilite_vendeur, date_collecte)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    produits[idx],
-                    self.marques_dict.get(row.get("Marque")),
-                    date_id,
-                    self.sources_dict.get(row.get("Source")),
-                    specs[idx],
-                    qualites[idx],
-                    row.get("Prix_Actuel_Clean"),
-                    row.get("Ancien_Prix_Clean"),
-                    row.get("Reduction_Reelle"),
-                    row.get("Discount"),
-                    row.get("Rating_Clean"),
-                    row.get("Rating"),
-                    row.get("Sentiment_Score_BERT"),
-                    row.get("Anomalie_Score_ML"),
-                    row.get("Anomalie_Score_Normalized"),
-                    row.get("Incoherence_Spec_Prix"),
-                    row.get("Severite_Incoherence"),
-                    row.get("Indice_Confiance"),
-                    row.get("Score_Fiabilite_Vendeur"),
-                    row.get("Date_Collecte"),
-                ),
-            )
-        self.conn.commit()
+        cles = _colonnes(df, [("Marque", None), ("Source", None)])
+
+        # Clés étrangères résolues colonne par colonne, puis mesures dans l'ordre de la table
+        faits = pd.concat(
+            [
+                pd.DataFrame({
+                    "produit_id": produits,
+                    "marque_id": _ids_par_code(cles["Marque"], self.marques_dict),
+                    "date_id": _cles_dates(dates),
+                    "source_id": _ids_par_code(cles["Source"], self.sources_dict),
+                    "spec_id": specs,
+                    "qualite_id": qualites,
+                }),
+                _colonnes(df, COLONNES_MESURES),
+            ],
+            axis=1,
+        )
+
+        with self._transaction():
+            self._inserer_multi("FACT_Ventes", COLONNES_FACT, faits.itertuples(index=False, name=None))
         print(f"✅ {len(df)} ventes insérées")
 
+    # ============================================================
+    # 🔍 Requêtes
+    # ============================================================
+    def execute_query(self, query: str, params=()) -> pd.DataFrame:
+        """Exécute une requête SELECT et renvoie le résultat sous forme de DataFrame"""
+        return pd.read_sql_query(query, self.conn, params=params)
+
     # ============================================================
     # 📈 Stats
     # ============================================================
     def get_statistics(self) -> Dict[str, int]:
-        tables = [
-            "Dim_Marques",
-            "Dim_Sources",
-            "Dim_Dates",
-            "Dim_Produits",
-            "Dim_Specifications",
-            "Dim_Qualite",
-            "FACT_Ventes",
-        ]
-        return {
-            t: self.cursor.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
-            for t in tables
-        }
+        return dict(self.cursor.execute(STATS_SQL).fetchall())
 
 
 # ============================================================
@@ -314,7 +651,8 @@ if __name__ == "__main__":
     db.create_schema()
 
     csv_file = BASE_DIR / "data" / "processed" / "ai_advanced_complete.csv"
-    db.load_csv_data(csv_file)
+    with db.bulk_load():
+        db.load_csv_data(csv_file)
 
     print("\n📊 Statistiques:")
     for table, count in db.get_statistics().items():
@@ -12,8 +12,15 @@ Ce script extrait les informations suivantes:
 - Note/Rating (si disponible)
 """
 
+import os
+import csv
+import json
 import time
+import queue
+import atexit
+import asyncio
 import logging
+import multiprocessing
 from datetime import datetime
 from pathlib import Path
 
@@ -24,13 +31,41 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Chemin rapide sans navigateur : pages catalogue en HTML statique (optionnel)
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    HTTP_AVAILABLE = True
+except ImportError:
+    HTTP_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - active HTTP/2 dans httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Navigateur de repli asynchrone : un seul Chromium, un contexte par page (optionnel)
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# pyarrow (optionnel) : copie Parquet+zstd typée du fichier brut
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Import de la configuration centralisée
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config import RPA_CONFIG, CSS_SELECTORS, RAW_DATA_FILE, LOGS_DIR, setup_directories
+from config import RPA_CONFIG, CSS_SELECTORS, RAW_DATA_FILE, RAW_PARTIAL_FILE, LOGS_DIR, setup_directories
 
 # --- CONFIGURATION DU LOGGING ---
 setup_directories()
@@ -44,6 +79,145 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# User-Agent réaliste, partagé par Chrome et le client HTTP
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+EN_TETES_HTTP = {"User-Agent": USER_AGENT, "Accept-Language": "fr-FR,fr;q=0.9"}
+
+# Colonnes du CSV brut, dans l'ordre des tuples produits par creer_produit
+COLONNES_PRODUIT = ["Titre", "Prix_Actuel", "Ancien_Prix", "Discount", "Rating", "Image_URL", "Source", "Date_Collecte"]
+
+# Connexions HTTP gardées vers chromedriver (urllib3 n'en garde qu'une par défaut,
+# ce qui sérialise les commandes WebDriver dès qu'elles sont concurrentes)
+TAILLE_POOL_WEBDRIVER = 16
+
+# Ressources jamais téléchargées : seules les URL des images sont collectées. Le CSS reste
+# chargé, innerText (texte extrait) dépendant du rendu des styles.
+URLS_BLOQUEES = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*/analytics*", "*/gtm*", "*googletagmanager*", "*doubleclick*",
+]
+TYPES_BLOQUES = {"image", "font", "media"}
+
+# Chemin de chromedriver mémorisé : webdriver-manager (accès réseau) n'est consulté
+# qu'une fois par semaine. La variable d'environnement CHROMEDRIVER est prioritaire.
+CACHE_CHROMEDRIVER = Path.home() / ".cache" / "smw" / "chromedriver.path"
+DUREE_CACHE_CHROMEDRIVER = 7 * 24 * 3600  # secondes
+
+# Scroll en bas de page puis rend la main dès que plus aucun produit n'est ajouté au DOM
+# pendant 500 ms (3 s au plus) : (sélecteur des produits, callback Selenium)
+JS_ATTENTE_PRODUITS = """const [conteneur, fini] = arguments;
+const observateur = new MutationObserver(mutations => {
+    const ajout = mutations.some(m => Array.from(m.addedNodes).some(
+        n => n.nodeType === 1 && (n.matches(conteneur) || n.querySelector(conteneur))));
+    if (ajout) {
+        clearTimeout(calme);
+        calme = setTimeout(terminer, 500);
+    }
+});
+const terminer = () => {
+    observateur.disconnect();
+    clearTimeout(calme);
+    clearTimeout(plafond);
+    fini();
+};
+let calme = setTimeout(terminer, 500);
+const plafond = setTimeout(terminer, 3000);
+observateur.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, document.body.scrollHeight);"""
+
+
+def generer_js_extraction(selecteurs):
+    """
+    Génère la fonction JS qui extrait tous les produits d'une page en un seul appel au
+    navigateur : articles -> [titre, prix, ancien prix, réduction, note, image] par article.
+    Les sélecteurs y sont inscrits en littéraux (json.dumps) : une seule forme de fonction
+    pour toutes les pages, rien à reconstruire ni à transmettre à chaque appel.
+    """
+    s = {cle: json.dumps(valeur) for cle, valeur in selecteurs.items()}
+    return f"""articles => articles.map(a => {{
+    const texte = sel => a.querySelector(sel)?.innerText?.trim() || null;
+    const img = a.querySelector({s["image"]});
+    return [texte({s["title"]}), texte({s["current_price"]}), texte({s["old_price"]}),
+            texte({s["discount"]}), texte({s["rating"]}),
+            img ? (img.getAttribute("data-src") || img.getAttribute("src")) : null];
+}})"""
+
+
+def _chemin_chromedriver():
+    """Retourne le chemin de chromedriver sans passer par le réseau quand il est connu."""
+    chemin = os.environ.get("CHROMEDRIVER")
+    if chemin:
+        return chemin
+    try:
+        if time.time() - CACHE_CHROMEDRIVER.stat().st_mtime < DUREE_CACHE_CHROMEDRIVER:
+            chemin = CACHE_CHROMEDRIVER.read_text(encoding="utf-8").strip()
+            if Path(chemin).is_file():
+                return chemin
+    except OSError:
+        pass  # Pas encore de cache
+    chemin = ChromeDriverManager().install()
+    CACHE_CHROMEDRIVER.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_CHROMEDRIVER.write_text(chemin, encoding="utf-8")
+    return chemin
+
+
+class DriverPool:
+    """
+    Navigateurs Chrome gardés ouverts entre deux exécutions du scraper dans le même
+    processus (RPA planifié, appels répétés) : évite ~3-5 s de démarrage par exécution.
+    """
+
+    def __init__(self, taille=1):
+        self.taille = taille
+        self._libres = queue.Queue()
+
+    def acquire(self, creer_driver):
+        """Retourne un navigateur du pool encore vivant, sinon en crée un avec creer_driver()."""
+        while True:
+            try:
+                driver = self._libres.get_nowait()
+            except queue.Empty:
+                return creer_driver()
+            try:
+                driver.current_url  # navigateur toujours joignable ?
+                return driver
+            except WebDriverException:
+                self._quitter(driver)
+
+    def release(self, driver):
+        """Remet le navigateur dans le pool, cookies et cache vidés (fermé si le pool est plein)."""
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        except WebDriverException:
+            self._quitter(driver)
+            return
+        if self._libres.qsize() < self.taille:
+            self._libres.put(driver)
+        else:
+            self._quitter(driver)
+
+    def fermer(self):
+        """Ferme tous les navigateurs en réserve."""
+        while True:
+            try:
+                self._quitter(self._libres.get_nowait())
+            except queue.Empty:
+                return
+
+    @staticmethod
+    def _quitter(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+# Pool du processus, vidé à la sortie de l'interpréteur
+DRIVER_POOL = DriverPool(RPA_CONFIG.get("navigateurs_en_reserve", 1))
+atexit.register(DRIVER_POOL.fermer)
+
 
 class JumiaScraper:
     """
@@ -51,14 +225,42 @@ class JumiaScraper:
     Conçue pour être robuste et respectueuse du site cible.
     """
 
+    # Boutons de fermeture des popups (newsletter/promo courantes sur Jumia), en un seul sélecteur
+    SELECTEUR_POPUP = ", ".join((
+        "button.cls",
+        "div.overlay button",
+        "[data-dismiss='modal']",
+        ".close-btn",
+    ))
+
     def __init__(self):
         self.url_base = RPA_CONFIG["url_base"]
         self.pages_a_scraper = RPA_CONFIG["pages_a_scraper"]
         self.delai = RPA_CONFIG["delai_entre_pages"]
         self.headless = RPA_CONFIG["headless"]
         self.retry_count = RPA_CONFIG.get("retry_count", 2)
+        self.pages_en_parallele = RPA_CONFIG.get("pages_en_parallele", 4)
+        self.processus_selenium = RPA_CONFIG.get("processus_selenium", 4)
         self.driver = None
+        self.client = None
         self.products = []
+        self.produits_par_page = {}
+        self.fichier_partiel = None
+        self._writer = None
+
+        # Sélecteurs lus une fois ici plutôt qu'à chaque produit
+        (self._sel_title, self._sel_price, self._sel_old,
+         self._sel_discount, self._sel_rating, self._sel_img) = (
+            CSS_SELECTORS[cle] for cle in ("title", "current_price", "old_price", "discount", "rating", "image")
+        )
+
+        # Extracteurs JS générés une fois par instance (Playwright : fonction sur les articles,
+        # Selenium : script complet sur la page)
+        self._js_extraction = generer_js_extraction(CSS_SELECTORS)
+        self._js_page = (
+            f"return ({self._js_extraction})("
+            f"Array.from(document.querySelectorAll({json.dumps(CSS_SELECTORS['product_container'])})));"
+        )
 
     def configurer_navigateur(self):
         """Configure et initialise le navigateur Chrome."""
@@ -72,17 +274,28 @@ class JumiaScraper:
         options.add_argument("--start-maximized")
         options.add_argument("--disable-notifications")
         options.add_argument("--lang=fr-FR")
+        options.add_argument("--blink-settings=imagesEnabled=false")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
 
         # User-Agent réaliste
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        options.add_argument(f"user-agent={USER_AGENT}")
 
         self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(_chemin_chromedriver()),
             options=options
         )
 
+        # Pool de connexions vers chromedriver : maxsize fait partie de la clé des pools
+        # urllib3, les requêtes suivantes passent donc par un pool à TAILLE_POOL_WEBDRIVER
+        pool = getattr(self.driver.command_executor, "_conn", None)
+        if pool is not None:
+            pool.connection_pool_kw["maxsize"] = TAILLE_POOL_WEBDRIVER
+
+        # Images, polices et traqueurs bloqués (imagesEnabled=false en filet de sécurité)
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": URLS_BLOQUEES})
+
         # Masquer le webdriver
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
@@ -91,102 +304,251 @@ class JumiaScraper:
 
     def fermer_popup(self):
         """Ferme les popups publicitaires si présentes."""
-        try:
-            # Popup newsletter/promo courante sur Jumia
-            close_buttons = [
-                "button.cls",
-                "div.overlay button",
-                "[data-dismiss='modal']",
-                ".close-btn"
-            ]
-            for selector in close_buttons:
-                try:
-                    btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    btn.click()
-                    logger.info("Popup fermée")
-                    time.sleep(0.5)
-                except NoSuchElementException:
-                    continue
-        except Exception:
-            pass  # Pas de popup, on continue
+        # Un seul aller-retour avec chromedriver ; liste vide s'il n'y a pas de popup.
+        # Seul le premier bouton cliquable est cliqué : "div.overlay button" peut aussi
+        # désigner d'autres boutons de la même fenêtre (inscription, acceptation...)
+        for btn in self.driver.find_elements(By.CSS_SELECTOR, self.SELECTEUR_POPUP):
+            try:
+                btn.click()
+            except WebDriverException:
+                continue  # Bouton masqué ou déjà retiré du DOM
+            logger.info("Popup fermée")
+            time.sleep(0.5)
+            break
+
+    def extraire_produit_html(self, article):
+        """Extrait les données d'un produit depuis un noeud HTML (selectolax)."""
+        def texte(selecteur):
+            element = article.css_first(selecteur)
+            return element.text(separator=" ", strip=True) if element else None
 
-    def extraire_produit(self, article):
-        """Extrait les données d'un seul produit."""
         try:
-            # TITRE
-            try:
-                titre = article.find_element(By.CSS_SELECTOR, CSS_SELECTORS["title"]).text.strip()
-            except NoSuchElementException:
-                titre = None
+            img_element = article.css_first(self._sel_img)
+            img_url = None
+            if img_element:
+                img_url = img_element.attributes.get("data-src") or img_element.attributes.get("src")
+
+            return self.creer_produit(
+                texte(self._sel_title),
+                texte(self._sel_price),
+                texte(self._sel_old),
+                texte(self._sel_discount),
+                texte(self._sel_rating),
+                img_url,
+            )
+        except Exception as e:
+            logger.warning(f"Erreur extraction produit: {e}")
 
-            # PRIX ACTUEL
-            try:
-                prix = article.find_element(By.CSS_SELECTOR, CSS_SELECTORS["current_price"]).text.strip()
-            except NoSuchElementException:
-                prix = None
+        return None
 
-            # ANCIEN PRIX (promo)
-            try:
-                ancien_prix = article.find_element(By.CSS_SELECTOR, CSS_SELECTORS["old_price"]).text.strip()
-            except NoSuchElementException:
-                ancien_prix = None
+    def creer_produit(self, titre, prix, ancien_prix, discount, rating, img_url):
+        """Construit l'enregistrement d'un produit, tuple dans l'ordre de COLONNES_PRODUIT (None sans titre ou sans prix)."""
+        # On ne garde que les produits avec au moins un titre et un prix
+        if titre and prix:
+            return (
+                titre,
+                prix,
+                ancien_prix,
+                discount,
+                rating,
+                img_url,
+                RPA_CONFIG["source_name"],
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        return None
 
-            # IMAGE URL
-            try:
-                img_element = article.find_element(By.CSS_SELECTOR, CSS_SELECTORS["image"])
-                img_url = img_element.get_attribute("data-src") or img_element.get_attribute("src")
-            except NoSuchElementException:
-                img_url = None
+    def url_page(self, page_num):
+        """URL d'une page du catalogue."""
+        # Gestion de l'URL avec pagination (compatible avec URL de recherche)
+        if "?" in self.url_base:
+            return f"{self.url_base}&page={page_num}"
+        return f"{self.url_base}?page={page_num}"
+
+    async def __aenter__(self):
+        """
+        Ouvre le client HTTP partagé par toutes les requêtes hors navigateur : connexions
+        TCP/TLS gardées ouvertes et réutilisées (HTTP/2 si disponible).
+        """
+        self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=EN_TETES_HTTP,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            follow_redirects=True,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        self.client = None
+
+    async def scraper_page_http(self, page_num):
+        """
+        Scrape une page en HTTP simple, sans navigateur (cartes produits rendues côté serveur).
+        Retourne None si la page doit être reprise avec un navigateur (aucun produit dans
+        le HTML ou échec réseau après les tentatives).
+        """
+        url = self.url_page(page_num)
+
+        for attempt in range(1, self.retry_count + 1):
+            logger.info(f"Traitement HTTP page {page_num} (tentative {attempt}/{self.retry_count}): {url}")
 
-            # RATING (Note)
             try:
-                rating_element = article.find_element(By.CSS_SELECTOR, CSS_SELECTORS["rating"])
-                rating = rating_element.text.strip()
-            except NoSuchElementException:
-                rating = None
+                response = await self.client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                if attempt < self.retry_count:
+                    logger.warning(f"Erreur HTTP page {page_num}: {e}, nouvelle tentative...")
+                    await asyncio.sleep(2)
+                    continue
+                logger.warning(f"Échec HTTP page {page_num}: {e}, reprise avec le navigateur")
+                return None
+
+            articles = HTMLParser(response.text).css(CSS_SELECTORS["product_container"])
+            if not articles:
+                logger.warning(f"Aucun produit dans le HTML de la page {page_num}, reprise avec le navigateur")
+                return None
+
+            logger.info(f"  -> {len(articles)} produits trouvés")
+            return [p for p in map(self.extraire_produit_html, articles) if p]
+
+        return None
 
-            # DISCOUNT (Pourcentage de réduction)
+    async def scraper_pages_http(self, pages):
+        """
+        Scrape les pages en HTTP, au plus `pages_en_parallele` à la fois, avec un seul
+        client (connexions réutilisées). Retourne les pages à reprendre avec un navigateur.
+        """
+        async with self:
+            resultats = await self.scraper_en_parallele(self.scraper_page_http, pages)
+        return self.fusionner_resultats(pages, resultats)
+
+    async def scraper_page_playwright(self, browser, page_num):
+        """
+        Scrape une page dans un contexte Playwright isolé (fermé ensuite, le navigateur
+        restant ouvert). Retourne None si la page doit être reprise avec Selenium.
+        """
+        url = self.url_page(page_num)
+
+        for attempt in range(1, self.retry_count + 1):
+            logger.info(f"Traitement Playwright page {page_num} (tentative {attempt}/{self.retry_count}): {url}")
+
+            context = await browser.new_context(user_agent=USER_AGENT, locale="fr-FR")
             try:
-                discount = article.find_element(By.CSS_SELECTOR, CSS_SELECTORS["discount"]).text.strip()
-            except NoSuchElementException:
-                discount = None
-
-            # On ne garde que les produits avec au moins un titre et un prix
-            if titre and prix:
-                return {
-                    "Titre": titre,
-                    "Prix_Actuel": prix,
-                    "Ancien_Prix": ancien_prix,
-                    "Discount": discount,
-                    "Rating": rating,
-                    "Image_URL": img_url,
-                    "Source": RPA_CONFIG["source_name"],
-                    "Date_Collecte": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-        except Exception as e:
-            logger.warning(f"Erreur extraction produit: {e}")
+                await context.route("**/*", self.filtrer_requete_playwright)
+                page = await context.new_page()
+                await page.goto(url, wait_until="domcontentloaded")
+                await page.wait_for_selector(
+                    CSS_SELECTORS["product_container"], state="attached", timeout=RPA_CONFIG["timeout"] * 1000
+                )
+                donnees = await page.eval_on_selector_all(CSS_SELECTORS["product_container"], self._js_extraction)
+            except Exception as e:
+                if attempt < self.retry_count:
+                    logger.warning(f"Erreur Playwright page {page_num}: {e}, nouvelle tentative...")
+                    await asyncio.sleep(2)
+                    continue
+                logger.warning(f"Échec Playwright page {page_num}: {e}, reprise avec Selenium")
+                return None
+            finally:
+                await context.close()
+
+            logger.info(f"  -> {len(donnees)} produits trouvés")
+            return [p for p in (self.creer_produit(*champs) for champs in donnees) if p]
 
         return None
 
+    @staticmethod
+    async def filtrer_requete_playwright(route):
+        """Bloque images, polices et médias (comme URLS_BLOQUEES côté Selenium)."""
+        if route.request.resource_type in TYPES_BLOQUES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def scraper_pages_playwright(self, pages):
+        """
+        Scrape les pages dans un seul Chromium, un contexte par page et au plus
+        `pages_en_parallele` à la fois. Retourne les pages à reprendre avec Selenium.
+        """
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled", "--disable-notifications"],
+            )
+            try:
+                resultats = await self.scraper_en_parallele(
+                    lambda page_num: self.scraper_page_playwright(browser, page_num), pages
+                )
+            finally:
+                await browser.close()
+        return self.fusionner_resultats(pages, resultats)
+
+    async def scraper_en_parallele(self, scraper_page, pages):
+        """
+        Lance scraper_page sur toutes les pages, au plus `pages_en_parallele` à la fois,
+        deux pages ne démarrant jamais à moins de `delai` secondes d'intervalle.
+        """
+        limite = asyncio.Semaphore(self.pages_en_parallele)
+        cadence = asyncio.Lock()
+        prochain_depart = 0.0
+
+        async def scraper_page_limitee(page_num):
+            nonlocal prochain_depart
+            async with limite:
+                async with cadence:
+                    await asyncio.sleep(max(0.0, prochain_depart - time.monotonic()))
+                    prochain_depart = time.monotonic() + self.delai
+                products = await scraper_page(page_num)
+            # Page écrite dès qu'elle est terminée, sans attendre les autres
+            if products is not None:
+                self.ecrire_partiel(products)
+            return products
+
+        return await asyncio.gather(*map(scraper_page_limitee, pages), return_exceptions=True)
+
+    def fusionner_resultats(self, pages, resultats):
+        """
+        Range les produits de chaque page obtenue dans produits_par_page.
+        Retourne les pages sans résultat (None ou exception), à reprendre.
+        """
+        a_reprendre = []
+        for page, products in zip(pages, resultats):
+            if isinstance(products, Exception):
+                logger.warning(f"Erreur page {page}: {products}, nouvelle reprise")
+                products = None
+            if products is None:
+                a_reprendre.append(page)
+                continue
+            self.produits_par_page[page] = products  # Déjà écrits dans RAW_PARTIAL_FILE
+            logger.info(f"  -> {len(products)} produits extraits de la page {page}")
+        return a_reprendre
+
+    def ecrire_partiel(self, products):
+        """
+        Écrit aussitôt les produits d'une page terminée dans RAW_PARTIAL_FILE : un arrêt
+        en cours de route ne perd pas les pages déjà collectées.
+        """
+        if self._writer:
+            self._writer.writerows(products)
+            self.fichier_partiel.flush()
+
+    def ajouter_produits(self, page, products):
+        """Écrit et range les produits d'une page terminée par Selenium."""
+        self.ecrire_partiel(products)
+        self.produits_par_page[page] = products
+        logger.info(f"  -> {len(products)} produits extraits de la page {page}")
+
     def scraper_page(self, page_num):
         """Scrape une page spécifique avec système de retry."""
-        # Gestion de l'URL avec pagination (compatible avec URL de recherche)
-        if "?" in self.url_base:
-            url = f"{self.url_base}&page={page_num}"
-        else:
-            url = f"{self.url_base}?page={page_num}"
+        url = self.url_page(page_num)
 
         for attempt in range(1, self.retry_count + 1):
             logger.info(f"Traitement page {page_num} (tentative {attempt}/{self.retry_count}): {url}")
 
             try:
                 self.driver.get(url)
-                time.sleep(self.delai)
-
-                # Fermer les popups éventuelles
-                self.fermer_popup()
 
-                # Attendre que les produits soient chargés
+                # Attendre que les produits soient chargés (pas de pause fixe)
                 try:
                     WebDriverWait(self.driver, RPA_CONFIG["timeout"]).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, CSS_SELECTORS["product_container"]))
@@ -200,24 +562,18 @@ class JumiaScraper:
                         logger.warning(f"Timeout final sur la page {page_num}")
                         return []
 
-                # Scroll progressif pour charger les images lazy-loaded
-                for scroll_pct in [0.3, 0.5, 0.7, 1.0]:
-                    self.driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight * {scroll_pct});")
-                    time.sleep(0.5)
-
-                time.sleep(1)
+                # Fermer les popups éventuelles
+                self.fermer_popup()
 
-                # Extraction des produits
-                articles = self.driver.find_elements(By.CSS_SELECTOR, CSS_SELECTORS["product_container"])
-                logger.info(f"  -> {len(articles)} produits trouvés")
+                # Un seul scroll, puis attente que plus aucun produit n'apparaisse (les images
+                # étant bloquées, data-src donne déjà leur URL)
+                self.driver.execute_async_script(JS_ATTENTE_PRODUITS, CSS_SELECTORS["product_container"])
 
-                page_products = []
-                for article in articles:
-                    product = self.extraire_produit(article)
-                    if product:
-                        page_products.append(product)
+                # Extraction de tous les produits en un seul aller-retour avec chromedriver
+                donnees = self.driver.execute_script(self._js_page)
+                logger.info(f"  -> {len(donnees)} produits trouvés")
 
-                return page_products
+                return [p for p in (self.creer_produit(*champs) for champs in donnees) if p]
 
             except Exception as e:
                 if attempt < self.retry_count:
@@ -238,12 +594,45 @@ class JumiaScraper:
         logger.info(f"Pages à scraper: {self.pages_a_scraper}")
 
         try:
-            self.configurer_navigateur()
-
-            for page in range(1, self.pages_a_scraper + 1):
-                products = self.scraper_page(page)
-                self.products.extend(products)
-                logger.info(f"  -> {len(products)} produits extraits de la page {page}")
+            pages = list(range(1, self.pages_a_scraper + 1))
+            self.produits_par_page = {}
+            self.fichier_partiel = open(RAW_PARTIAL_FILE, "w", newline="", encoding="utf-8-sig")
+            self._writer = csv.writer(self.fichier_partiel)
+            self._writer.writerow(COLONNES_PRODUIT)
+
+            # HTTP d'abord ; un navigateur n'est lancé que pour les pages où il a échoué,
+            # Playwright s'il est installé, Selenium en dernier recours
+            if HTTP_AVAILABLE:
+                pages = asyncio.run(self.scraper_pages_http(pages))
+            else:
+                logger.info("httpx/selectolax absents : scraping avec un navigateur")
+
+            if pages and PLAYWRIGHT_AVAILABLE:
+                pages = asyncio.run(self.scraper_pages_playwright(pages))
+
+            # Selenium n'étant pas thread-safe, plusieurs pages restantes sont réparties
+            # entre des processus ayant chacun leur Chrome
+            processus = min(self.processus_selenium, len(pages), os.cpu_count() or 1)
+            if processus > 1:
+                # Prochain départ autorisé, partagé : les processus respectent aussi delai_entre_pages
+                cadence = multiprocessing.Value("d", 0.0)
+                with multiprocessing.Pool(processus, _initialiser_processus, (cadence,)) as pool:
+                    parts = [pages[i::processus] for i in range(processus)]
+                    # Chaque part est écrite dès que son processus a terminé
+                    for part in pool.imap_unordered(_scraper_pages_selenium, parts):
+                        for page, products in part:
+                            self.ajouter_produits(page, products)
+            elif pages:
+                self.driver = DRIVER_POOL.acquire(self.configurer_navigateur)
+                for i, page in enumerate(pages):
+                    if i:
+                        time.sleep(self.delai)
+                    self.ajouter_produits(page, self.scraper_page(page))
+
+            # Produits dans l'ordre des pages, quelle que soit l'étape (HTTP, Playwright,
+            # Selenium) qui a fini par obtenir chacune
+            for page in sorted(self.produits_par_page):
+                self.products.extend(self.produits_par_page[page])
 
             logger.info("=" * 50)
             logger.info(f"SCRAPING TERMINÉ: {len(self.products)} produits au total")
@@ -253,20 +642,46 @@ class JumiaScraper:
             logger.error(f"Erreur critique: {e}")
             raise
         finally:
+            if self.fichier_partiel:
+                self.fichier_partiel.close()
+                self.fichier_partiel = self._writer = None
             if self.driver:
-                self.driver.quit()
-                logger.info("Navigateur fermé")
+                DRIVER_POOL.release(self.driver)
+                self.driver = None
+                logger.info("Navigateur rendu au pool")
 
         return self.products
 
-    def sauvegarder_csv(self, filepath=None):
-        """Sauvegarde les données en CSV."""
+    @staticmethod
+    def _post_traitement(df):
+        """
+        Colonnes propres à la copie Parquet, dérivées des textes bruts en opérations vectorisées :
+        Prix_Num / Ancien_Prix_Num ('1,389.00 Dhs' -> 1389.0) et Discount_Pct ('39%' -> 39).
+        Les colonnes brutes sont conservées telles quelles ; le CSV brut ne change pas de schéma.
+        """
+        for colonne in ("Prix_Actuel", "Ancien_Prix"):
+            chiffres = df[colonne].astype("string").str.replace(r"[^\d.]", "", regex=True)
+            df[colonne.replace("_Actuel", "") + "_Num"] = pd.to_numeric(chiffres, errors="coerce")
+        pourcentage = df["Discount"].astype("string").str.extract(r"(-?\d+)", expand=False)
+        df["Discount_Pct"] = pd.to_numeric(pourcentage, errors="coerce").astype("Int16")
+        df["Source"] = df["Source"].astype("category")
+        return df
+
+    def sauvegarder_csv(self, filepath=None, output_format="csv"):
+        """
+        Sauvegarde les données en CSV.
+
+        Args:
+            filepath (str|Path): Chemin du CSV (RAW_DATA_FILE par défaut)
+            output_format (str): 'csv', ou 'parquet' pour écrire en plus une copie
+                                 Parquet+zstd typée à côté du CSV
+        """
         if not self.products:
             logger.warning("Aucun produit à sauvegarder!")
             return None
 
         filepath = filepath or RAW_DATA_FILE
-        df = pd.DataFrame(self.products)
+        df = pd.DataFrame.from_records(self.products, columns=COLONNES_PRODUIT)
 
         # Créer le dossier parent si nécessaire
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
@@ -275,10 +690,58 @@ class JumiaScraper:
         df.to_csv(filepath, index=False, encoding="utf-8-sig")
         logger.info(f"Données sauvegardées: {filepath}")
         logger.info(f"  -> {len(df)} lignes, {len(df.columns)} colonnes")
+        # Le fichier final est écrit : la sauvegarde page par page n'a plus d'utilité
+        RAW_PARTIAL_FILE.unlink(missing_ok=True)
+
+        if output_format == "parquet":
+            if not PYARROW_AVAILABLE:
+                logger.warning("pyarrow non installé - copie Parquet ignorée")
+                return df
+            fichier_parquet = Path(filepath).with_suffix(".parquet")
+            copie = self._post_traitement(df.copy())
+            copie.to_parquet(fichier_parquet, engine="pyarrow", compression="zstd", index=False)
+            logger.info(f"Copie Parquet sauvegardée: {fichier_parquet}")
 
         return df
 
 
+# Prochain départ de page autorisé (horodatage), partagé entre les processus du repli Selenium
+_CADENCE = None
+
+
+def _initialiser_processus(cadence):
+    """Initialisation d'un processus du pool Selenium : reçoit la cadence partagée."""
+    global _CADENCE
+    _CADENCE = cadence
+
+
+def _attendre_depart(delai):
+    """Attend son tour : deux pages, tous processus confondus, démarrent à `delai` s d'intervalle."""
+    with _CADENCE.get_lock():
+        time.sleep(max(0.0, _CADENCE.value - time.time()))
+        _CADENCE.value = time.time() + delai
+
+
+def _scraper_pages_selenium(pages):
+    """
+    Travail d'un processus du repli Selenium : scrape ses pages avec son propre Chrome.
+    Fonction de module pour pouvoir être envoyée à multiprocessing.Pool.
+
+    Returns:
+        list: (numéro de page, produits) pour chaque page
+    """
+    scraper = JumiaScraper()
+    scraper.configurer_navigateur()
+    try:
+        resultats = []
+        for page in pages:
+            _attendre_depart(scraper.delai)
+            resultats.append((page, scraper.scraper_page(page)))
+        return resultats
+    finally:
+        scraper.driver.quit()
+
+
 def main():
     """Point d'entrée principal du script RPA."""
     scraper = JumiaScraper()
@@ -288,7 +751,7 @@ def main():
         scraper.lancer_scraping()
 
         # Sauvegarder les résultats
-        df = scraper.sauvegarder_csv()
+        df = scraper.sauvegarder_csv(output_format="parquet")
 
         if df is not None:
             print("\n" + "=" * 50)
@@ -40,7 +40,8 @@ def test_database():
         print("    processed/")
         print("      ai_advanced_complete.csv")
     else:
-        db.load_csv_data(csv_path)
+        with db.bulk_load():
+            db.load_csv_data(csv_path)
         
         # Afficher les statistiques
         print("\n📊 Étape 3: Vérification des données...")